@@ -4,6 +4,34 @@ set -euo pipefail
 FIXTURES_SRC="fixtures/src"
 FIXTURES_OUT="fixtures/epub"
 
+# Add the files under the current directory (except the root mimetype) to
+# $1 in sorted path order, compared byte by byte (LC_ALL=C) so the archive
+# layout does not depend on the caller's locale. Entries under 2 KB are
+# stored: deflating them costs more time than it saves space. Anything
+# larger gets a fast deflate.
+# Consecutive entries with the same method go to zip in one call, so the
+# archive stays in path order without running zip once per file.
+zip_entries() {
+    local out_file="$1"
+    local size path level
+    local batch_level=""
+    local -a batch=()
+
+    while IFS=$'\t' read -r size path; do
+        if [ "$size" -lt 2048 ]; then level=0; else level=1; fi
+        if [ "$level" != "$batch_level" ] && [ ${#batch[@]} -gt 0 ]; then
+            zip -X"$batch_level" "$out_file" "${batch[@]}"
+            batch=()
+        fi
+        batch_level="$level"
+        batch+=("$path")
+    done < <(find . -type f ! -path ./mimetype -printf '%s\t%p\n' | LC_ALL=C sort -t$'\t' -k2)
+
+    if [ ${#batch[@]} -gt 0 ]; then
+        zip -X"$batch_level" "$out_file" "${batch[@]}"
+    fi
+}
+
 build_epub() {
     local src_dir="$1"
     local out_file="$2"
@@ -16,10 +44,8 @@ build_epub() {
     cd "$src_dir"
     if [ -f mimetype ]; then
         zip -X0 "$out_file" mimetype
-        zip -Xr9D "$out_file" . -x mimetype
-    else
-        zip -Xr9D "$out_file" .
     fi
+    zip_entries "$out_file"
     cd - > /dev/null
 }
 
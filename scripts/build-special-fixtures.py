@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """Build fixtures requiring non-standard zip manipulation."""
-import zipfile, os, struct
+import io, zipfile, os, stat
 
 FIXTURES_SRC = "fixtures/src"
 FIXTURES_OUT = "fixtures/epub"
@@ -9,27 +9,96 @@ BASE = os.path.join(FIXTURES_SRC, "valid", "minimal-epub3")
 
 
 def collect_files(src_dir, exclude=None):
-    """Walk src_dir, yield (arcname, filepath) pairs."""
-    for root, dirs, files in os.walk(src_dir):
-        dirs.sort()
-        for f in sorted(files):
-            arcname = os.path.relpath(os.path.join(root, f), src_dir)
+    """Yield (arcname, filepath) pairs under src_dir.
+
+    Files in a directory come before its subdirectories, each in name
+    order, matching a sorted os.walk.  os.scandir hands back the entry
+    type with the name, so no separate stat is needed per entry.
+    """
+    def scan(path):
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry.path)
+                continue
+            arcname = os.path.relpath(entry.path, src_dir)
             if exclude and arcname in exclude:
                 continue
-            yield arcname, os.path.join(root, f)
+            yield arcname, entry.path
+        for subdir in subdirs:
+            yield from scan(subdir)
+
+    return scan(src_dir)
+
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def write_file(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+# (arcname, bytes) for every file in BASE, read on first use and shared by
+# all builders.
+BASE_CACHE = None
+
+
+def base_entries(exclude=()):
+    """Return the cached (arcname, bytes) list for BASE, minus exclude."""
+    global BASE_CACHE
+    if BASE_CACHE is None:
+        BASE_CACHE = [(arcname, read_file(filepath))
+                      for arcname, filepath in collect_files(BASE)]
+    return [(arcname, data) for arcname, data in BASE_CACHE
+            if arcname not in exclude]
+
+
+def base_file(arcname):
+    """Return the bytes of a single file in BASE."""
+    return dict(base_entries())[arcname]
+
+
+# Extra field injected into the mimetype local header: an unknown tag
+# 0xCAFE with 4 bytes of zero data, little-endian (8 bytes total).
+EXTRA_DATA = b'\xfe\xca\x04\x00\x00\x00\x00\x00'
+
+
+def zip_info(arcname, compress_type):
+    """ZipInfo with a fixed timestamp so rebuilt fixtures are byte-identical."""
+    info = zipfile.ZipInfo(arcname, date_time=(1980, 1, 1, 0, 0, 0))
+    info.compress_type = compress_type
+    info.external_attr = (stat.S_IFREG | 0o644) << 16
+    return info
+
+
+def write_base_entries(zf):
+    """Write the non-mimetype base files, stored uncompressed.
+
+    Deflating a handful of sub-kilobyte XML files costs more than it saves,
+    and only the mimetype entry's compression matters to these fixtures.
+    """
+    for arcname, data in base_entries(exclude={"mimetype"}):
+        zf.writestr(zip_info(arcname, zipfile.ZIP_STORED), data)
 
 
 def build_mimetype_not_first():
     """mimetype exists but is not the first entry in the zip."""
     out = os.path.join(FIXTURES_OUT, "invalid", "ocf-mimetype-not-first.epub")
     os.makedirs(os.path.dirname(out), exist_ok=True)
-    with zipfile.ZipFile(out, 'w') as zf:
+    # Assemble the archive in memory and write it out once: zipfile seeks
+    # back to rewrite every local header after the entry's CRC is known.
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as zf:
         # Write other files first
-        for arcname, filepath in collect_files(BASE, exclude={"mimetype"}):
-            zf.write(filepath, arcname, compress_type=zipfile.ZIP_DEFLATED)
+        write_base_entries(zf)
         # Then mimetype last (stored, but not first)
-        zf.write(os.path.join(BASE, "mimetype"), "mimetype",
-                 compress_type=zipfile.ZIP_STORED)
+        zf.writestr(zip_info("mimetype", zipfile.ZIP_STORED), base_file("mimetype"))
+    write_file(out, buf.getbuffer())
     print(f"  Built: {out}")
 
 
@@ -37,11 +106,11 @@ def build_mimetype_compressed():
     """mimetype is first but uses DEFLATED instead of STORED."""
     out = os.path.join(FIXTURES_OUT, "invalid", "ocf-mimetype-compressed.epub")
     os.makedirs(os.path.dirname(out), exist_ok=True)
-    with zipfile.ZipFile(out, 'w') as zf:
-        zf.write(os.path.join(BASE, "mimetype"), "mimetype",
-                 compress_type=zipfile.ZIP_DEFLATED)
-        for arcname, filepath in collect_files(BASE, exclude={"mimetype"}):
-            zf.write(filepath, arcname, compress_type=zipfile.ZIP_DEFLATED)
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as zf:
+        zf.writestr(zip_info("mimetype", zipfile.ZIP_DEFLATED), base_file("mimetype"))
+        write_base_entries(zf)
+    write_file(out, buf.getbuffer())
     print(f"  Built: {out}")
 
 
@@ -50,47 +119,38 @@ def build_mimetype_extra_field():
     out = os.path.join(FIXTURES_OUT, "invalid", "ocf-mimetype-extra-field.epub")
     os.makedirs(os.path.dirname(out), exist_ok=True)
 
-    # Build a normal epub first
-    tmp = out + ".tmp"
-    with zipfile.ZipFile(tmp, 'w') as zf:
-        zf.write(os.path.join(BASE, "mimetype"), "mimetype",
-                 compress_type=zipfile.ZIP_STORED)
-        for arcname, filepath in collect_files(BASE, exclude={"mimetype"}):
-            zf.write(filepath, arcname, compress_type=zipfile.ZIP_DEFLATED)
+    # Build a normal epub in memory first
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as zf:
+        zf.writestr(zip_info("mimetype", zipfile.ZIP_STORED), base_file("mimetype"))
+        write_base_entries(zf)
 
-    # Now patch the local file header to add an extra field
-    with open(tmp, 'rb') as f:
-        data = bytearray(f.read())
+    data = buf.getbuffer()
+    header = bytearray(data[:30])
 
     # The local file header starts at offset 0 for the first entry
     # Local file header signature = 0x04034b50
-    assert data[0:4] == b'PK\x03\x04', "Expected local file header at offset 0"
+    assert header[0:4] == b'PK\x03\x04', "Expected local file header at offset 0"
 
     # Extra field length is at offset 28-29 (2 bytes, little-endian)
     # Currently should be 0
-    extra_len = struct.unpack_from('<H', data, 28)[0]
-
-    # We need to inject an extra field. The extra field for the mimetype entry.
-    # Extra field: a simple unknown tag with some data
-    extra_data = struct.pack('<HH', 0xCAFE, 4) + b'\x00\x00\x00\x00'  # 8 bytes total
+    extra_len = int.from_bytes(header[28:30], 'little')
 
     # File name length at offset 26
-    fname_len = struct.unpack_from('<H', data, 26)[0]
-
-    # Insert point: after local header (30 bytes) + filename + existing extra
-    insert_at = 30 + fname_len + extra_len
+    fname_len = int.from_bytes(header[26:28], 'little')
 
-    # Update extra field length
-    new_extra_len = extra_len + len(extra_data)
-    struct.pack_into('<H', data, 28, new_extra_len)
-
-    # Insert the extra data
-    data[insert_at:insert_at] = extra_data
+    # Update extra field length to cover the injected extra field
+    header[28:30] = (extra_len + len(EXTRA_DATA)).to_bytes(2, 'little')
 
+    # Header, filename + existing extra, the injected extra, then the
+    # remainder of the archive unchanged, spliced from the buffer without
+    # copying it
+    end = 30 + fname_len + extra_len
     with open(out, 'wb') as f:
-        f.write(data)
-
-    os.remove(tmp)
+        f.write(header)
+        f.write(data[30:end])
+        f.write(EXTRA_DATA)
+        f.write(data[end:])
     print(f"  Built: {out}")
 
 
@@ -103,20 +163,17 @@ def build_manifest_duplicate_item_same_resource():
     correctly on the case-sensitive Linux CI filesystem too.
     """
     epub = os.path.join(FIXTURES_OUT, "invalid", "manifest-duplicate-item-same-resource.epub")
-    tmp = epub + ".tmp"
-
-    with zipfile.ZipFile(epub, 'r') as zin:
-        chapter1_data = zin.read("OEBPS/chapter1.xhtml")
-        with zipfile.ZipFile(tmp, 'w') as zout:
-            for item in zin.infolist():
-                zout.writestr(item, zin.read(item.filename))
-            # Insert the case-variant entry (same content, different capitalisation).
-            # epubcheck flags OPF-060 when two ZIP entries are case-insensitively equal.
-            dup = zipfile.ZipInfo("OEBPS/Chapter1.xhtml")
-            dup.compress_type = zipfile.ZIP_DEFLATED
-            zout.writestr(dup, chapter1_data)
-
-    os.replace(tmp, epub)
+
+    # Append in place: existing entries keep their compressed payloads and
+    # only the central directory is rewritten.  build-fixtures.sh re-zips
+    # the epub from source before every run, so nothing is lost if this
+    # is interrupted.
+    with zipfile.ZipFile(epub, 'a') as zf:
+        chapter1_data = zf.read("OEBPS/chapter1.xhtml")
+        # Insert the case-variant entry (same content, different capitalisation).
+        # epubcheck flags OPF-060 when two ZIP entries are case-insensitively equal.
+        zf.writestr(zip_info("OEBPS/Chapter1.xhtml", zipfile.ZIP_DEFLATED), chapter1_data)
+
     print(f"  Built: {epub}")
 
 
@@ -4,9 +4,10 @@
 Reads reference/*.json files, extracts the key information, and creates
 expected/*.json files with our curated check IDs and notes.
 """
-import json
 import os
 
+from expectedlib import json_dumps, load_reference
+
 REFERENCE_DIR = "reference"
 EXPECTED_DIR = "expected"
 
@@ -337,13 +338,10 @@ LEVEL2_CHECKS = {
 
 def read_reference(category, name):
     """Read a reference JSON file and extract key info."""
-    ref_path = os.path.join(REFERENCE_DIR, category, f"{name}.json")
-    if not os.path.exists(ref_path):
+    data = load_reference(os.path.join(REFERENCE_DIR, category, f"{name}.json"))
+    if data is None:
         return None
 
-    with open(ref_path) as f:
-        data = json.load(f)
-
     messages = data.get("messages", [])
     fatal_count = sum(1 for m in messages if m["severity"] == "FATAL")
     error_count = sum(1 for m in messages if m["severity"] == "ERROR")
@@ -428,9 +426,8 @@ def main():
     # Create expected for valid EPUB 2
     os.makedirs(os.path.join(EXPECTED_DIR, "valid"), exist_ok=True)
     valid_epub2_path = os.path.join(EXPECTED_DIR, "valid", "minimal-epub2.json")
-    with open(valid_epub2_path, "w") as f:
-        json.dump(create_valid_expected("minimal-epub2"), f, indent=2)
-        f.write("\n")
+    with open(valid_epub2_path, "wb") as f:
+        f.write(json_dumps(create_valid_expected("minimal-epub2")))
     print(f"Created: valid/minimal-epub2.json")
 
     # Create expected for each Level 2 invalid fixture
@@ -448,9 +445,8 @@ def main():
         expected = create_expected(fixture_name, check_info, ref_data)
 
         out_path = os.path.join(EXPECTED_DIR, "invalid", f"{fixture_name}.json")
-        with open(out_path, "w") as f:
-            json.dump(expected, f, indent=2)
-            f.write("\n")
+        with open(out_path, "wb") as f:
+            f.write(json_dumps(expected))
 
         status = "valid=true (note)" if expected["valid"] else f"F={expected['fatal_count']} E={expected['error_count']} W={expected['warning_count']}"
         print(f"Created: invalid/{fixture_name}.json  [{status}]")
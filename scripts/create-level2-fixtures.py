@@ -3,142 +3,93 @@
 
 Each fixture is based on minimal-epub3 with exactly ONE defect introduced.
 """
+import concurrent.futures
+import functools
 import os
-import shutil
+import sys
+
+from fixturelib import (
+    BOOK_ID, CHAPTER1_ITEM, CHAPTER1_ITEMREF, CHAPTER1_XHTML, CONTAINER_XML, DC_METADATA,
+    DEFAULTS_BYTES, EPUB2_DEFAULTS, FIXTURES_SRC, MIMETYPE, NAV_ITEM, NAV_XHTML, PACKAGE_OPEN,
+    build_epub2_opf, build_opf, build_xhtml, check_fixture_names, encode_files, write_fixture,
+)
 
-FIXTURES_SRC = "fixtures/src"
 BASE = os.path.join(FIXTURES_SRC, "valid", "minimal-epub3")
-INVALID_DIR = os.path.join(FIXTURES_SRC, "invalid")
-
-# --- Base file contents (from minimal-epub3) ---
-
-MIMETYPE = "application/epub+zip"
-
-CONTAINER_XML = """<?xml version="1.0" encoding="UTF-8"?>
-<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
-  <rootfiles>
-    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
-  </rootfiles>
-</container>"""
-
-CONTENT_OPF = """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>"""
 
-NAV_XHTML = """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
-<head><title>Navigation</title></head>
-<body>
-  <nav epub:type="toc">
-    <h1>Table of Contents</h1>
-    <ol>
-      <li><a href="chapter1.xhtml">Chapter 1</a></li>
-    </ol>
-  </nav>
-</body>
-</html>"""
 
-CHAPTER1_XHTML = """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>"""
+# name -> (category, creator). Each creator returns {relative_path: content}
+# for its fixture; invalid fixtures are layered over DEFAULTS_BYTES, where a
+# content of None drops that default file.
+FIXTURES = {}
 
+# [(section title, [fixture name, ...])], in registration order; section()
+# opens a group and every @fixture after it joins that group.
+FIXTURE_GROUPS = []
 
-def create_fixture(name, files):
-    """Create a fixture directory with the given files.
 
-    files is a dict of {relative_path: content}.
-    Always includes mimetype and META-INF/container.xml unless overridden.
-    """
-    fixture_dir = os.path.join(INVALID_DIR, name)
-    if os.path.exists(fixture_dir):
-        shutil.rmtree(fixture_dir)
+def section(title):
+    """Start a new group of fixtures, printed under title when built."""
+    FIXTURE_GROUPS.append((title, []))
 
-    # Default files
-    defaults = {
-        "mimetype": MIMETYPE,
-        "META-INF/container.xml": CONTAINER_XML,
-        "OEBPS/content.opf": CONTENT_OPF,
-        "OEBPS/nav.xhtml": NAV_XHTML,
-        "OEBPS/chapter1.xhtml": CHAPTER1_XHTML,
-    }
-    defaults.update(files)
 
-    for relpath, content in defaults.items():
-        filepath = os.path.join(fixture_dir, relpath)
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        if isinstance(content, bytes):
-            with open(filepath, 'wb') as f:
-                f.write(content)
-        else:
-            with open(filepath, 'w', newline='') as f:
-                f.write(content)
+def fixture(name, category="invalid"):
+    """Register the decorated function as the creator of fixture name."""
+    def register(creator):
+        FIXTURES[name] = (category, creator)
+        FIXTURE_GROUPS[-1][1].append(name)
+        return creator
+    return register
 
-    print(f"  Created: {name}")
 
+@functools.lru_cache(maxsize=None)
+def get_fixture(name):
+    """Return {relative_path: bytes} for one fixture, built on first request.
 
-def create_valid_fixture(name, files):
-    """Create a valid fixture directory."""
-    fixture_dir = os.path.join(FIXTURES_SRC, "valid", name)
-    if os.path.exists(fixture_dir):
-        shutil.rmtree(fixture_dir)
+    Only the named fixture's creator runs. The returned dict is shared
+    between callers and must not be modified.
+    """
+    category, creator = FIXTURES[name]
+    files = encode_files(creator())
+    if category == "invalid":
+        files = {**DEFAULTS_BYTES, **files}
+    return {relpath: content for relpath, content in files.items()
+            if content is not None}
 
-    for relpath, content in files.items():
-        filepath = os.path.join(fixture_dir, relpath)
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        if isinstance(content, bytes):
-            with open(filepath, 'wb') as f:
-                f.write(content)
-        else:
-            with open(filepath, 'w', newline='') as f:
-                f.write(content)
 
-    print(f"  Created valid: {name}")
+def create_fixture(name):
+    """Write fixture name to fixtures/src/<category>/<name>.
+
+    Returns the progress line to report, so that callers running fixtures
+    concurrently can print the lines in order.
+    """
+    category, _creator = FIXTURES[name]
+    label = " valid" if category == "valid" else ""
+    if write_fixture(os.path.join(FIXTURES_SRC, category, name), get_fixture(name)):
+        return f"  Created{label}: {name}"
+    return f"  Unchanged{label}: {name}"
 
 
 # ============================================================
 # OPF STRUCTURAL CHECKS
 # ============================================================
 
-def create_opf_malformed_xml():
+section("OPF Structural")
+
+
+@fixture("opf-malformed-xml")
+def opf_malformed_xml():
     """OPF-011: OPF file must be well-formed XML."""
-    create_fixture("opf-malformed-xml", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  <!-- missing closing tags -->"""
-    })
-
-
-def create_opf_missing_metadata():
+    return {
+        "OEBPS/content.opf": f"""{PACKAGE_OPEN}  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+{DC_METADATA}  <!-- missing closing tags -->"""
+    }
+
+
+@fixture("opf-missing-metadata")
+def opf_missing_metadata():
     """OPF-012: Package must have metadata element."""
-    create_fixture("opf-missing-metadata", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <manifest>
+    return {
+        "OEBPS/content.opf": f"""{PACKAGE_OPEN}  <manifest>
     <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
     <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
   </manifest>
@@ -146,619 +97,382 @@ def create_opf_missing_metadata():
     <itemref idref="chapter1"/>
   </spine>
 </package>"""
-    })
+    }
 
 
-def create_opf_missing_manifest():
+@fixture("opf-missing-manifest")
+def opf_missing_manifest():
     """OPF-013: Package must have manifest element."""
-    create_fixture("opf-missing-manifest", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
+    return {
+        "OEBPS/content.opf": f"""{PACKAGE_OPEN}  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+{DC_METADATA}  </metadata>
   <spine>
     <itemref idref="chapter1"/>
   </spine>
 </package>"""
-    })
+    }
 
 
-def create_opf_missing_spine():
+@fixture("opf-missing-spine")
+def opf_missing_spine():
     """OPF-014: Package must have spine element."""
-    create_fixture("opf-missing-spine", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-</package>"""
-    })
+    return {
+        "OEBPS/content.opf": build_opf(spine=None)
+    }
 
 
-def create_opf_wrong_version():
+@fixture("opf-wrong-version")
+def opf_wrong_version():
     """OPF-015: Package version must be valid ("2.0" or "3.0")."""
-    create_fixture("opf-wrong-version", {
-        "OEBPS/content.opf": CONTENT_OPF.replace('version="3.0"', 'version="4.0"')
-    })
+    return {
+        "OEBPS/content.opf": build_opf(version="4.0")
+    }
 
 
-def create_opf_duplicate_manifest_href():
+@fixture("opf-duplicate-manifest-href")
+def opf_duplicate_manifest_href():
     """OPF-016: Manifest must not have duplicate hrefs."""
-    create_fixture("opf-duplicate-manifest-href", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="chapter1dup" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>"""
-    })
+    return {
+        "OEBPS/content.opf": build_opf(manifest=[
+            NAV_ITEM,
+            CHAPTER1_ITEM,
+            '<item id="chapter1dup" href="chapter1.xhtml" media-type="application/xhtml+xml"/>',
+        ])
+    }
 
 
-def create_opf_duplicate_spine_idref():
+@fixture("opf-duplicate-spine-idref")
+def opf_duplicate_spine_idref():
     """OPF-017: Spine should not have duplicate idrefs."""
-    create_fixture("opf-duplicate-spine-idref", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>"""
-    })
+    return {
+        "OEBPS/content.opf": build_opf(spine=[
+            CHAPTER1_ITEMREF,
+            CHAPTER1_ITEMREF,
+        ])
+    }
 
 
-def create_opf_manifest_item_no_id():
+@fixture("opf-manifest-item-no-id")
+def opf_manifest_item_no_id():
     """OPF-018: Each manifest item must have an id attribute."""
-    create_fixture("opf-manifest-item-no-id", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>"""
-    })
+    return {
+        "OEBPS/content.opf": build_opf(manifest=[
+            NAV_ITEM,
+            '<item href="chapter1.xhtml" media-type="application/xhtml+xml"/>',
+        ])
+    }
 
 
-def create_opf_dcterms_modified_invalid():
+@fixture("opf-dcterms-modified-invalid")
+def opf_dcterms_modified_invalid():
     """OPF-019: dcterms:modified must have valid date format."""
-    create_fixture("opf-dcterms-modified-invalid", {
-        "OEBPS/content.opf": CONTENT_OPF.replace(
-            "2025-01-01T00:00:00Z", "not-a-valid-date"
-        )
-    })
+    return {
+        "OEBPS/content.opf": build_opf(modified="not-a-valid-date")
+    }
 
 
-def create_opf_dc_language_invalid():
+@fixture("opf-dc-language-invalid")
+def opf_dc_language_invalid():
     """OPF-020: dc:language must be a valid BCP 47 language tag."""
-    create_fixture("opf-dc-language-invalid", {
-        "OEBPS/content.opf": CONTENT_OPF.replace(
-            "<dc:language>en</dc:language>",
-            "<dc:language>invalidlanguagetag123</dc:language>"
-        )
-    })
+    return {
+        "OEBPS/content.opf": build_opf(language="invalidlanguagetag123")
+    }
 
 
 # ============================================================
 # OPF FALLBACK / MEDIA TYPE CHECKS
 # ============================================================
 
-def create_opf_fallback_ref_missing():
+section("OPF Fallback/Media")
+
+
+@fixture("opf-fallback-ref-missing")
+def opf_fallback_ref_missing():
     """OPF-021: Fallback attribute must reference an existing manifest item."""
-    create_fixture("opf-fallback-ref-missing", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" fallback="nonexistent"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>"""
-    })
+    return {
+        "OEBPS/content.opf": build_opf(manifest=[
+            NAV_ITEM,
+            '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" fallback="nonexistent"/>',
+        ])
+    }
+
 
+CHAPTER2_XHTML = CHAPTER1_XHTML.replace("Chapter 1", "Chapter 2")
 
-def create_opf_fallback_cycle():
+
+@fixture("opf-fallback-cycle")
+def opf_fallback_cycle():
     """OPF-022: Fallback chains must not be circular."""
-    create_fixture("opf-fallback-cycle", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" fallback="chapter2"/>
-    <item id="chapter2" href="chapter2.xhtml" media-type="application/xhtml+xml" fallback="chapter1"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-        "OEBPS/chapter2.xhtml": CHAPTER1_XHTML.replace("Chapter 1", "Chapter 2"),
-    })
+    return {
+        "OEBPS/content.opf": build_opf(manifest=[
+            NAV_ITEM,
+            '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" fallback="chapter2"/>',
+            '<item id="chapter2" href="chapter2.xhtml" media-type="application/xhtml+xml" fallback="chapter1"/>',
+        ]),
+        "OEBPS/chapter2.xhtml": CHAPTER2_XHTML,
+    }
 
 
-def create_opf_spine_non_content_doc():
+@fixture("opf-spine-non-content-doc")
+def opf_spine_non_content_doc():
     """OPF-023: Spine items must be content documents (XHTML or SVG)."""
     # Put a CSS file in the spine
-    create_fixture("opf-spine-non-content-doc", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="style" href="style.css" media-type="text/css"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-    <itemref idref="style"/>
-  </spine>
-</package>""",
+    return {
+        "OEBPS/content.opf": build_opf(manifest=[
+            NAV_ITEM,
+            CHAPTER1_ITEM,
+            '<item id="style" href="style.css" media-type="text/css"/>',
+        ], spine=[
+            CHAPTER1_ITEMREF,
+            '<itemref idref="style"/>',
+        ]),
         "OEBPS/style.css": "body { margin: 0; }",
-    })
+    }
 
 
-def create_opf_media_type_mismatch():
+@fixture("opf-media-type-mismatch")
+def opf_media_type_mismatch():
     """OPF-024: Declared media-type should match actual file content."""
     # Declare chapter1.xhtml as image/png
-    create_fixture("opf-media-type-mismatch", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="image/png"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>"""
-    })
+    return {
+        "OEBPS/content.opf": build_opf(manifest=[
+            NAV_ITEM,
+            '<item id="chapter1" href="chapter1.xhtml" media-type="image/png"/>',
+        ])
+    }
 
 
-def create_opf_cover_image_not_image():
+@fixture("opf-cover-image-not-image")
+def opf_cover_image_not_image():
     """OPF-025: cover-image property must be on an image item."""
-    create_fixture("opf-cover-image-not-image", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" properties="cover-image"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>"""
-    })
+    return {
+        "OEBPS/content.opf": build_opf(manifest=[
+            NAV_ITEM,
+            '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" properties="cover-image"/>',
+        ])
+    }
 
 
-def create_opf_multiple_nav():
+@fixture("opf-multiple-nav")
+def opf_multiple_nav():
     """OPF-026: Only one manifest item should have properties="nav"."""
-    create_fixture("opf-multiple-nav", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="nav2" href="nav2.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+    return {
+        "OEBPS/content.opf": build_opf(manifest=[
+            NAV_ITEM,
+            '<item id="nav2" href="nav2.xhtml" media-type="application/xhtml+xml" properties="nav"/>',
+            CHAPTER1_ITEM,
+        ]),
         "OEBPS/nav2.xhtml": NAV_XHTML,
-    })
+    }
 
 
 # ============================================================
 # RSC RESOURCE REFERENCE CHECKS
 # ============================================================
 
-def create_content_fragment_id_missing():
+section("RSC Resources")
+
+
+@fixture("content-fragment-id-missing")
+def content_fragment_id_missing():
     """RSC-003: Fragment identifiers must resolve to valid targets."""
-    create_fixture("content-fragment-id-missing", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p><a href="chapter1.xhtml#nonexistent">Link to nowhere</a></p>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(body=[
+            '<p><a href="chapter1.xhtml#nonexistent">Link to nowhere</a></p>',
+        ]),
+    }
 
 
-def create_content_remote_resource():
+@fixture("content-remote-resource")
+def content_remote_resource():
     """RSC-004: Remote resources are not allowed (with few exceptions)."""
-    create_fixture("content-remote-resource", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p><img src="http://example.com/image.png" alt="remote"/></p>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(body=[
+            '<p><img src="http://example.com/image.png" alt="remote"/></p>',
+        ]),
+    }
 
 
-def create_content_css_file_missing():
+@fixture("content-css-file-missing")
+def content_css_file_missing():
     """RSC-005: CSS file declared in manifest but missing from zip."""
-    create_fixture("content-css-file-missing", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="style" href="style.css" media-type="text/css"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+    return {
+        "OEBPS/content.opf": build_opf(manifest=[
+            NAV_ITEM,
+            CHAPTER1_ITEM,
+            '<item id="style" href="style.css" media-type="text/css"/>',
+        ]),
         # Note: style.css is NOT included in the fixture files
-    })
+    }
 
 
-def create_content_resource_not_in_manifest():
+@fixture("content-resource-not-in-manifest")
+def content_resource_not_in_manifest():
     """RSC-006: Resources used in content must be declared in manifest."""
-    create_fixture("content-resource-not-in-manifest", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <link rel="stylesheet" type="text/css" href="style.css"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(head=[
+            '<link rel="stylesheet" type="text/css" href="style.css"/>',
+        ]),
         # CSS file exists but is NOT in the manifest
         "OEBPS/style.css": "body { margin: 0; }",
-    })
+    }
 
 
-def create_content_font_file_missing():
+@fixture("content-font-file-missing")
+def content_font_file_missing():
     """RSC-007: Font file declared in manifest but missing from zip."""
-    create_fixture("content-font-file-missing", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="font1" href="fonts/missing.woff2" media-type="font/woff2"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+    return {
+        "OEBPS/content.opf": build_opf(manifest=[
+            NAV_ITEM,
+            CHAPTER1_ITEM,
+            '<item id="font1" href="fonts/missing.woff2" media-type="font/woff2"/>',
+        ]),
         # Note: fonts/missing.woff2 is NOT included
-    })
+    }
 
 
-def create_content_remote_stylesheet():
+@fixture("content-remote-stylesheet")
+def content_remote_stylesheet():
     """RSC-008: Remote CSS stylesheet not allowed."""
-    create_fixture("content-remote-stylesheet", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <link rel="stylesheet" type="text/css" href="http://example.com/style.css"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(head=[
+            '<link rel="stylesheet" type="text/css" href="http://example.com/style.css"/>',
+        ]),
+    }
 
 
 # ============================================================
 # HTM CONTENT DOCUMENT CHECKS
 # ============================================================
 
-def create_content_no_title():
+section("HTM Content")
+
+
+@fixture("content-no-title")
+def content_no_title():
     """HTM-002: XHTML content documents must have a title element."""
-    create_fixture("content-no-title", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(title=None),
+    }
 
 
-def create_content_empty_href():
+@fixture("content-empty-href")
+def content_empty_href():
     """HTM-003: href attributes must not be empty."""
-    create_fixture("content-empty-href", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p><a href="">Empty link</a></p>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(body=[
+            '<p><a href="">Empty link</a></p>',
+        ]),
+    }
 
 
-def create_content_obsolete_element():
+@fixture("content-obsolete-element")
+def content_obsolete_element():
     """HTM-004: Content documents must not use obsolete HTML elements."""
-    create_fixture("content-obsolete-element", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <center><p>This uses an obsolete element.</p></center>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(body=[
+            '<center><p>This uses an obsolete element.</p></center>',
+        ]),
+    }
 
 
-def create_content_scripted_undeclared():
+@fixture("content-scripted-undeclared")
+def content_scripted_undeclared():
     """HTM-005: Scripted content must declare scripted property in manifest."""
-    create_fixture("content-scripted-undeclared", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-  <script type="text/javascript">alert('hello');</script>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(body=[
+            '<p>Hello, world.</p>',
+            "<script type=\"text/javascript\">alert('hello');</script>",
+        ]),
+    }
 
 
-def create_content_svg_undeclared():
+@fixture("content-svg-undeclared")
+def content_svg_undeclared():
     """HTM-006: Inline SVG must declare svg property in manifest."""
-    create_fixture("content-svg-undeclared", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">
-    <circle cx="50" cy="50" r="40" fill="red"/>
-  </svg>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(body=[
+            '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">',
+            '  <circle cx="50" cy="50" r="40" fill="red"/>',
+            '</svg>',
+        ]),
+    }
 
 
-def create_content_mathml_undeclared():
+@fixture("content-mathml-undeclared")
+def content_mathml_undeclared():
     """HTM-007: MathML content must declare mathml property in manifest."""
-    create_fixture("content-mathml-undeclared", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <math xmlns="http://www.w3.org/1998/Math/MathML">
-    <mrow><mi>x</mi><mo>=</mo><mn>2</mn></mrow>
-  </math>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(body=[
+            '<math xmlns="http://www.w3.org/1998/Math/MathML">',
+            '  <mrow><mi>x</mi><mo>=</mo><mn>2</mn></mrow>',
+            '</math>',
+        ]),
+    }
 
 
-def create_content_fxl_no_viewport():
+@fixture("content-fxl-no-viewport")
+def content_fxl_no_viewport():
     """HTM-008: Fixed-layout documents must have a viewport meta tag."""
-    create_fixture("content-fxl-no-viewport", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="rendition:layout">pre-paginated</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+    return {
+        "OEBPS/content.opf": build_opf(meta=[
+            '<meta property="rendition:layout">pre-paginated</meta>',
+        ]),
         # chapter1.xhtml has NO viewport meta
-    })
+    }
 
 
-def create_content_fxl_invalid_viewport():
+@fixture("content-fxl-invalid-viewport")
+def content_fxl_invalid_viewport():
     """HTM-009: Fixed-layout viewport meta must have valid syntax."""
-    create_fixture("content-fxl-invalid-viewport", {
-        "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="rendition:layout">pre-paginated</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <meta name="viewport" content="invalid-viewport-value"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/content.opf": build_opf(meta=[
+            '<meta property="rendition:layout">pre-paginated</meta>',
+        ]),
+        "OEBPS/chapter1.xhtml": build_xhtml(head=[
+            '<meta name="viewport" content="invalid-viewport-value"/>',
+        ]),
+    }
 
 
-def create_content_base_element():
+@fixture("content-base-element")
+def content_base_element():
     """HTM-010: base element is not allowed in EPUB content documents."""
-    create_fixture("content-base-element", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <base href="http://example.com/"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(head=[
+            '<base href="http://example.com/"/>',
+        ]),
+    }
 
 
-def create_content_wrong_doctype():
+@fixture("content-wrong-doctype")
+def content_wrong_doctype():
     """HTM-011: DOCTYPE must be correct for XHTML content docs."""
-    create_fixture("content-wrong-doctype", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(doctype='<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">'),
+    }
 
 
-def create_content_wrong_namespace():
+@fixture("content-wrong-namespace")
+def content_wrong_namespace():
     """HTM-012: html element must use the XHTML namespace."""
     # Use a wrong namespace — this should cause XML parsing issues
-    create_fixture("content-wrong-namespace", {
-        "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.example.com/wrong-namespace">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-    })
+    return {
+        "OEBPS/chapter1.xhtml": build_xhtml(xmlns='http://www.example.com/wrong-namespace'),
+    }
 
 
 # ============================================================
 # NAV NAVIGATION CHECKS
 # ============================================================
 
-def create_nav_toc_broken_link():
+section("NAV Navigation")
+
+
+@fixture("nav-toc-broken-link")
+def nav_toc_broken_link():
     """NAV-003: TOC nav links must reference existing resources."""
-    create_fixture("nav-toc-broken-link", {
+    return {
         "OEBPS/nav.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
@@ -773,12 +487,13 @@ def create_nav_toc_broken_link():
   </nav>
 </body>
 </html>""",
-    })
+    }
 
 
-def create_nav_toc_empty_link():
+@fixture("nav-toc-empty-link")
+def nav_toc_empty_link():
     """NAV-004: Navigation links must have text content."""
-    create_fixture("nav-toc-empty-link", {
+    return {
         "OEBPS/nav.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
@@ -792,12 +507,13 @@ def create_nav_toc_empty_link():
   </nav>
 </body>
 </html>""",
-    })
+    }
 
 
-def create_nav_multiple_toc():
+@fixture("nav-multiple-toc")
+def nav_multiple_toc():
     """NAV-005: Navigation document must have exactly one toc nav."""
-    create_fixture("nav-multiple-toc", {
+    return {
         "OEBPS/nav.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
@@ -817,12 +533,13 @@ def create_nav_multiple_toc():
   </nav>
 </body>
 </html>""",
-    })
+    }
 
 
-def create_nav_landmarks_broken():
+@fixture("nav-landmarks-broken")
+def nav_landmarks_broken():
     """NAV-006: Landmarks nav links must resolve to valid targets."""
-    create_fixture("nav-landmarks-broken", {
+    return {
         "OEBPS/nav.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
@@ -842,12 +559,13 @@ def create_nav_landmarks_broken():
   </nav>
 </body>
 </html>""",
-    })
+    }
 
 
-def create_nav_page_list_broken():
+@fixture("nav-page-list-broken")
+def nav_page_list_broken():
     """NAV-007: Page list references must resolve to valid targets."""
-    create_fixture("nav-page-list-broken", {
+    return {
         "OEBPS/nav.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
@@ -867,34 +585,26 @@ def create_nav_page_list_broken():
   </nav>
 </body>
 </html>""",
-    })
+    }
 
 
 # ============================================================
 # EPUB 2 CHECKS
 # ============================================================
 
-EPUB2_OPF = """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-  </metadata>
-  <manifest>
-    <item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine toc="ncx">
-    <itemref idref="chapter1"/>
-  </spine>
-</package>"""
+section("EPUB 2")
+
+
+EPUB2_OPF = EPUB2_DEFAULTS["OEBPS/content.opf"]
+EPUB2_CHAPTER = EPUB2_DEFAULTS["OEBPS/chapter1.xhtml"]
 
-EPUB2_NCX = """<?xml version="1.0" encoding="UTF-8"?>
+# The minimal-epub2 NCX declares its DTD; the EPUB2_DEFAULTS copy that
+# levels 3 and 4 build on does not.
+EPUB2_NCX = f"""<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE ncx PUBLIC "-//NISO//DTD ncx 2005-1//EN" "http://www.daisy.org/z3986/2005/ncx-2005-1.dtd">
 <ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
   <head>
-    <meta name="dtb:uid" content="urn:uuid:12345678-1234-1234-1234-123456789012"/>
+    <meta name="dtb:uid" content="{BOOK_ID}"/>
     <meta name="dtb:depth" content="1"/>
     <meta name="dtb:totalPageCount" content="0"/>
     <meta name="dtb:maxPageNumber" content="0"/>
@@ -908,75 +618,56 @@ EPUB2_NCX = """<?xml version="1.0" encoding="UTF-8"?>
   </navMap>
 </ncx>"""
 
-EPUB2_CHAPTER = """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>"""
-
-EPUB2_CONTAINER = """<?xml version="1.0" encoding="UTF-8"?>
-<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
-  <rootfiles>
-    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
-  </rootfiles>
-</container>"""
-
 
-def create_valid_epub2():
+@fixture("minimal-epub2", category="valid")
+def valid_epub2():
     """Minimal valid EPUB 2 fixture."""
-    create_valid_fixture("minimal-epub2", {
+    return {
         "mimetype": MIMETYPE,
-        "META-INF/container.xml": EPUB2_CONTAINER,
+        "META-INF/container.xml": CONTAINER_XML,
         "OEBPS/content.opf": EPUB2_OPF,
         "OEBPS/toc.ncx": EPUB2_NCX,
         "OEBPS/chapter1.xhtml": EPUB2_CHAPTER,
-    })
+    }
 
 
-def create_epub2_ncx_missing():
+@fixture("epub2-ncx-missing")
+def epub2_ncx_missing():
     """E2-001: EPUB 2 must have NCX file."""
-    create_fixture("epub2-ncx-missing", {
+    return {
         "OEBPS/content.opf": EPUB2_OPF,
         "OEBPS/chapter1.xhtml": EPUB2_CHAPTER,
         # NCX file is NOT included
-    })
-    # Remove nav.xhtml since this is EPUB 2
-    nav_path = os.path.join(INVALID_DIR, "epub2-ncx-missing", "OEBPS", "nav.xhtml")
-    if os.path.exists(nav_path):
-        os.remove(nav_path)
+        "OEBPS/nav.xhtml": None,  # EPUB 2 has no navigation document
+    }
 
 
-def create_epub2_ncx_malformed():
+@fixture("epub2-ncx-malformed")
+def epub2_ncx_malformed():
     """E2-002: NCX must be well-formed XML."""
-    create_fixture("epub2-ncx-malformed", {
+    return {
         "OEBPS/content.opf": EPUB2_OPF,
-        "OEBPS/toc.ncx": """<?xml version="1.0" encoding="UTF-8"?>
+        "OEBPS/toc.ncx": f"""<?xml version="1.0" encoding="UTF-8"?>
 <ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
   <head>
-    <meta name="dtb:uid" content="urn:uuid:12345678-1234-1234-1234-123456789012"/>
+    <meta name="dtb:uid" content="{BOOK_ID}"/>
   </head>
   <!-- broken: missing closing tags""",
         "OEBPS/chapter1.xhtml": EPUB2_CHAPTER,
-    })
-    # Remove nav.xhtml since this is EPUB 2
-    nav_path = os.path.join(INVALID_DIR, "epub2-ncx-malformed", "OEBPS", "nav.xhtml")
-    if os.path.exists(nav_path):
-        os.remove(nav_path)
+        "OEBPS/nav.xhtml": None,  # EPUB 2 has no navigation document
+    }
 
 
-def create_epub2_ncx_no_navmap():
+@fixture("epub2-ncx-no-navmap")
+def epub2_ncx_no_navmap():
     """E2-003: NCX must have navMap element."""
-    create_fixture("epub2-ncx-no-navmap", {
+    return {
         "OEBPS/content.opf": EPUB2_OPF,
-        "OEBPS/toc.ncx": """<?xml version="1.0" encoding="UTF-8"?>
+        "OEBPS/toc.ncx": f"""<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE ncx PUBLIC "-//NISO//DTD ncx 2005-1//EN" "http://www.daisy.org/z3986/2005/ncx-2005-1.dtd">
 <ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
   <head>
-    <meta name="dtb:uid" content="urn:uuid:12345678-1234-1234-1234-123456789012"/>
+    <meta name="dtb:uid" content="{BOOK_ID}"/>
     <meta name="dtb:depth" content="1"/>
     <meta name="dtb:totalPageCount" content="0"/>
     <meta name="dtb:maxPageNumber" content="0"/>
@@ -984,95 +675,58 @@ def create_epub2_ncx_no_navmap():
   <docTitle><text>Test Book</text></docTitle>
 </ncx>""",
         "OEBPS/chapter1.xhtml": EPUB2_CHAPTER,
-    })
-    # Remove nav.xhtml since this is EPUB 2
-    nav_path = os.path.join(INVALID_DIR, "epub2-ncx-no-navmap", "OEBPS", "nav.xhtml")
-    if os.path.exists(nav_path):
-        os.remove(nav_path)
+        "OEBPS/nav.xhtml": None,  # EPUB 2 has no navigation document
+    }
 
 
-def create_epub2_spine_no_toc():
+@fixture("epub2-spine-no-toc")
+def epub2_spine_no_toc():
     """E2-004: EPUB 2 spine must have toc attribute referencing NCX."""
-    opf_no_toc = EPUB2_OPF.replace(' toc="ncx"', '')
-    create_fixture("epub2-spine-no-toc", {
-        "OEBPS/content.opf": opf_no_toc,
+    return {
+        "OEBPS/content.opf": build_epub2_opf(spine_attrs=""),
         "OEBPS/toc.ncx": EPUB2_NCX,
         "OEBPS/chapter1.xhtml": EPUB2_CHAPTER,
-    })
-    # Remove nav.xhtml since this is EPUB 2
-    nav_path = os.path.join(INVALID_DIR, "epub2-spine-no-toc", "OEBPS", "nav.xhtml")
-    if os.path.exists(nav_path):
-        os.remove(nav_path)
+        "OEBPS/nav.xhtml": None,  # EPUB 2 has no navigation document
+    }
 
 
 # ============================================================
 # MAIN
 # ============================================================
 
-if __name__ == "__main__":
-    print("Creating Level 2 fixture source directories...")
-    print()
+def build_all(names=None, parallel=True):
+    """Create the Level 2 fixtures, section by section.
+
+    names limits the build to those fixtures; by default every fixture is
+    created. Every fixture writes its own directory and the work is almost
+    all file I/O, which releases the GIL, so with parallel=True each
+    section fans out across a thread pool; parallel=False creates the
+    fixtures in order in this thread, which keeps tracebacks simple.
+    """
+    check_fixture_names(names, FIXTURES)
+
+    executor = concurrent.futures.ThreadPoolExecutor() if parallel else None
+    try:
+        for title, group in FIXTURE_GROUPS:
+            if names is not None:
+                group = [name for name in group if name in names]
+                if not group:
+                    continue
+            print(f"\n=== {title} ===", flush=True)
+            if executor is None:
+                lines = map(create_fixture, group)
+            else:
+                lines = executor.map(create_fixture, group)
+            # One write per section rather than one per fixture.
+            print("\n".join(lines), flush=True)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-    # OPF Structural
-    print("=== OPF Structural ===")
-    create_opf_malformed_xml()
-    create_opf_missing_metadata()
-    create_opf_missing_manifest()
-    create_opf_missing_spine()
-    create_opf_wrong_version()
-    create_opf_duplicate_manifest_href()
-    create_opf_duplicate_spine_idref()
-    create_opf_manifest_item_no_id()
-    create_opf_dcterms_modified_invalid()
-    create_opf_dc_language_invalid()
-
-    # OPF Fallback/Media
-    print("\n=== OPF Fallback/Media ===")
-    create_opf_fallback_ref_missing()
-    create_opf_fallback_cycle()
-    create_opf_spine_non_content_doc()
-    create_opf_media_type_mismatch()
-    create_opf_cover_image_not_image()
-    create_opf_multiple_nav()
-
-    # RSC Resources
-    print("\n=== RSC Resources ===")
-    create_content_fragment_id_missing()
-    create_content_remote_resource()
-    create_content_css_file_missing()
-    create_content_resource_not_in_manifest()
-    create_content_font_file_missing()
-    create_content_remote_stylesheet()
-
-    # HTM Content
-    print("\n=== HTM Content ===")
-    create_content_no_title()
-    create_content_empty_href()
-    create_content_obsolete_element()
-    create_content_scripted_undeclared()
-    create_content_svg_undeclared()
-    create_content_mathml_undeclared()
-    create_content_fxl_no_viewport()
-    create_content_fxl_invalid_viewport()
-    create_content_base_element()
-    create_content_wrong_doctype()
-    create_content_wrong_namespace()
-
-    # NAV Navigation
-    print("\n=== NAV Navigation ===")
-    create_nav_toc_broken_link()
-    create_nav_toc_empty_link()
-    create_nav_multiple_toc()
-    create_nav_landmarks_broken()
-    create_nav_page_list_broken()
-
-    # EPUB 2
-    print("\n=== EPUB 2 ===")
-    create_valid_epub2()
-    create_epub2_ncx_missing()
-    create_epub2_ncx_malformed()
-    create_epub2_ncx_no_navmap()
-    create_epub2_spine_no_toc()
 
+if __name__ == "__main__":
+    print("Creating Level 2 fixture source directories...", flush=True)
+    # Optional fixture names on the command line rebuild just those.
+    build_all(sys.argv[1:] or None)
     print()
     print("Done! Created all Level 2 fixture source directories.")
@@ -3,9 +3,10 @@
 
 Based on analysis of epubcheck 5.3.0 reference output.
 """
-import json
+import concurrent.futures
 import os
-import re
+
+from expectedlib import json_dumps, load_reference
 
 EXPECTED_DIR = "expected"
 REFERENCE_DIR = "reference"
@@ -403,9 +404,8 @@ def create_expected(fixture_name, check_info, category="invalid"):
         # Read reference to get actual counts
         ref_path = os.path.join(REFERENCE_DIR, category, f"{fixture_name}.json")
         error_count_min = None
-        if os.path.exists(ref_path):
-            with open(ref_path) as f:
-                ref = json.load(f)
+        ref = load_reference(ref_path)
+        if ref is not None:
             ref_fatals = ref["checker"]["nFatal"]
             ref_errors = ref["checker"]["nError"]
             ref_warnings = ref["checker"]["nWarning"]
@@ -440,11 +440,10 @@ def create_expected(fixture_name, check_info, category="invalid"):
             "warning_count": warning_count,
         }
 
-    with open(out_file, 'w') as f:
-        json.dump(expected, f, indent=2)
-        f.write('\n')
+    with open(out_file, 'wb') as f:
+        f.write(json_dumps(expected))
 
-    print(f"  Created: {out_file}")
+    return out_file
 
 
 def create_valid_expected(fixture_name):
@@ -463,21 +462,25 @@ def create_valid_expected(fixture_name):
         "warning_count": 0,
     }
 
-    with open(out_file, 'w') as f:
-        json.dump(expected, f, indent=2)
-        f.write('\n')
+    with open(out_file, 'wb') as f:
+        f.write(json_dumps(expected))
 
-    print(f"  Created: {out_file}")
+    return out_file
 
 
 if __name__ == "__main__":
     print("Creating Level 3 expected output files...\n")
 
-    for fixture_name, check_info in sorted(LEVEL3_CHECKS.items()):
-        create_expected(fixture_name, check_info)
+    # Each fixture reads its own reference file and writes its own expected
+    # file, so the I/O-bound work runs on a thread pool; results come back
+    # in submission order and are printed with a single write.
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        out_files = executor.map(lambda item: create_expected(*item),
+                                 sorted(LEVEL3_CHECKS.items()))
+        print("\n".join(f"  Created: {out_file}" for out_file in out_files))
 
     print("\nCreating valid fixture expected files...")
-    create_valid_expected("fxl-epub3")
-    create_valid_expected("epub3-with-css")
+    print(f"  Created: {create_valid_expected('fxl-epub3')}")
+    print(f"  Created: {create_valid_expected('epub3-with-css')}")
 
     print(f"\nDone! Created {len(LEVEL3_CHECKS)} invalid + 2 valid expected files.")
@@ -5,677 +5,222 @@ Level 3 — "Production validator" (~140 checks total, ~70 new)
 Covers: CSS validation, navigation edge cases, fixed-layout enhancements,
 full EPUB 2, encoding checks, image validation, additional OPF/content checks.
 """
+import concurrent.futures
 import os
-import shutil
+import sys
+
+from fixturelib import (
+    BOOK_ID, CHAPTER1_ITEM, DEFAULTS_BYTES, EPUB2_DEFAULTS_BYTES, FIXTURES_SRC, MODIFIED,
+    NAV_ITEM, build_opf, build_xhtml, check_fixture_names, encode_files, write_fixture,
+)
 
-FIXTURES_SRC = "fixtures/src"
 BASE_EPUB3 = os.path.join(FIXTURES_SRC, "valid", "minimal-epub3")
 BASE_EPUB2 = os.path.join(FIXTURES_SRC, "valid", "minimal-epub2")
 
-# Default file contents for minimal-epub3
-DEFAULTS = {
-    "mimetype": "application/epub+zip",
-    "META-INF/container.xml": """<?xml version="1.0" encoding="UTF-8"?>
-<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
-  <rootfiles>
-    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
-  </rootfiles>
-</container>""",
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/nav.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
-<head><title>Navigation</title></head>
-<body>
-  <nav epub:type="toc">
-    <h1>Table of Contents</h1>
-    <ol>
-      <li><a href="chapter1.xhtml">Chapter 1</a></li>
-    </ol>
-  </nav>
-</body>
-</html>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-}
-
-EPUB2_DEFAULTS = {
-    "mimetype": "application/epub+zip",
-    "META-INF/container.xml": DEFAULTS["META-INF/container.xml"],
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-  </metadata>
-  <manifest>
-    <item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine toc="ncx">
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/toc.ncx": """<?xml version="1.0" encoding="UTF-8"?>
-<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
-  <head>
-    <meta name="dtb:uid" content="urn:uuid:12345678-1234-1234-1234-123456789012"/>
-    <meta name="dtb:depth" content="1"/>
-    <meta name="dtb:totalPageCount" content="0"/>
-    <meta name="dtb:maxPageNumber" content="0"/>
-  </head>
-  <docTitle><text>Test Book</text></docTitle>
-  <navMap>
-    <navPoint id="np-1" playOrder="1">
-      <navLabel><text>Chapter 1</text></navLabel>
-      <content src="chapter1.xhtml"/>
-    </navPoint>
-  </navMap>
-</ncx>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-}
-
-
-def create_fixture(name, files, base="epub3"):
-    """Create fixture directory with given files merged over defaults."""
-    defaults = DEFAULTS if base == "epub3" else EPUB2_DEFAULTS
-    fixture_dir = os.path.join(FIXTURES_SRC, "invalid", name)
-    if os.path.exists(fixture_dir):
-        shutil.rmtree(fixture_dir)
-
-    merged = dict(defaults)
-    merged.update(files)
-
-    for filepath, content in merged.items():
-        full_path = os.path.join(fixture_dir, filepath)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        if isinstance(content, bytes):
-            with open(full_path, 'wb') as f:
-                f.write(content)
-        else:
-            with open(full_path, 'w', newline='') as f:
-                f.write(content)
-
-    print(f"  Created: {fixture_dir}")
-    return fixture_dir
-
-
-def create_valid_fixture(name, files, base="epub3"):
-    """Create valid fixture directory."""
-    defaults = DEFAULTS if base == "epub3" else EPUB2_DEFAULTS
-    fixture_dir = os.path.join(FIXTURES_SRC, "valid", name)
-    if os.path.exists(fixture_dir):
-        shutil.rmtree(fixture_dir)
-
-    merged = dict(defaults)
-    merged.update(files)
-
-    for filepath, content in merged.items():
-        full_path = os.path.join(fixture_dir, filepath)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        if isinstance(content, bytes):
-            with open(full_path, 'wb') as f:
-                f.write(content)
-        else:
-            with open(full_path, 'w', newline='') as f:
-                f.write(content)
-
-    print(f"  Created: {fixture_dir}")
-    return fixture_dir
-
-
-# ============================================================================
-# CSS Validation Checks
-# ============================================================================
-print("\n=== CSS Validation Checks ===")
-
-# CSS-001: css-well-formed - CSS file with syntax errors
-create_fixture("css-syntax-error", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="css" href="style.css" media-type="text/css"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <link rel="stylesheet" type="text/css" href="style.css"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-    "OEBPS/style.css": "body { color: ; }\np { font-size }\n",
-})
-
-# CSS-002: css-invalid-property - CSS with invalid property name
-create_fixture("css-invalid-property", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="css" href="style.css" media-type="text/css"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <link rel="stylesheet" type="text/css" href="style.css"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-    "OEBPS/style.css": "body { fake-property: 10px; }\n",
-})
-
-# CSS-003: css-font-face-missing-src - @font-face without src
-create_fixture("css-font-face-no-src", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="css" href="style.css" media-type="text/css"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <link rel="stylesheet" type="text/css" href="style.css"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-    "OEBPS/style.css": "@font-face {\n  font-family: 'MyFont';\n  font-weight: normal;\n}\nbody { font-family: 'MyFont'; }\n",
-})
-
-# CSS-004: css-font-face-remote-src - @font-face with remote URL
-create_fixture("css-font-face-remote", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="css" href="style.css" media-type="text/css"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <link rel="stylesheet" type="text/css" href="style.css"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-    "OEBPS/style.css": "@font-face {\n  font-family: 'RemoteFont';\n  src: url('https://example.com/font.woff2');\n}\nbody { font-family: 'RemoteFont'; }\n",
-})
+# Manifest entry and link for the shared stylesheet
+CSS_ITEM = '<item id="css" href="style.css" media-type="text/css"/>'
+STYLESHEET_LINK = '<link rel="stylesheet" type="text/css" href="style.css"/>'
 
-# CSS-005: css-import-not-allowed - @import in EPUB CSS
-create_fixture("css-import", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="css" href="style.css" media-type="text/css"/>
-    <item id="css2" href="other.css" media-type="text/css"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <link rel="stylesheet" type="text/css" href="style.css"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-    "OEBPS/style.css": "@import url('other.css');\nbody { color: black; }\n",
-    "OEBPS/other.css": "p { color: blue; }\n",
-})
+# Minimal 1x1 white PNG
+MINIMAL_PNG = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82'
 
-# CSS-006: css-font-face-bad-src - @font-face src pointing to nonexistent file
-create_fixture("css-font-face-missing-file", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="css" href="style.css" media-type="text/css"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <link rel="stylesheet" type="text/css" href="style.css"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-    "OEBPS/style.css": "@font-face {\n  font-family: 'MyFont';\n  src: url('fonts/nonexistent.woff');\n}\nbody { font-family: 'MyFont'; }\n",
-})
+# Minimal WAV header
+MINIMAL_WAV = b'RIFF$\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00D\xac\x00\x00\x88X\x01\x00\x02\x00\x10\x00data\x00\x00\x00\x00'
 
-# CSS-007: css-background-image-missing - CSS background-image pointing to missing file
-create_fixture("css-background-image-missing", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="css" href="style.css" media-type="text/css"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <link rel="stylesheet" type="text/css" href="style.css"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p class="decorated">Hello, world.</p>
-</body>
-</html>""",
-    "OEBPS/style.css": ".decorated { background-image: url('images/nonexistent.png'); }\n",
-})
+# Just a stub file - webp content doesn't matter for the checks that use it
+STUB_WEBP = b'RIFF\x00\x00\x00\x00WEBP'
 
-# CSS-008: css-resource-not-in-manifest - CSS references resource not in manifest
-create_fixture("css-resource-not-in-manifest", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="css" href="style.css" media-type="text/css"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <link rel="stylesheet" type="text/css" href="style.css"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p class="decorated">Hello, world.</p>
-</body>
-</html>""",
-    # Create a real image file but don't put it in manifest
-    "OEBPS/style.css": ".decorated { background-image: url('bg.png'); }\n",
-    # Minimal 1x1 white PNG
-    "OEBPS/bg.png": b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82',
-})
 
+# name -> (category, files, base) for every fixture declared below, and
+# [(section title, [name, ...])] in declaration order; section() opens a
+# group and fixture() and valid_fixture() add to it. Nothing is written
+# until create_fixture() or build_all() asks for it.
+FIXTURES = {}
+FIXTURE_GROUPS = []
 
-# ============================================================================
-# Fixed-Layout Enhancement Checks
-# ============================================================================
-print("\n=== Fixed-Layout Enhancement Checks ===")
 
-# FXL-001: rendition-layout in metadata
-create_fixture("fxl-rendition-layout-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="rendition:layout">invalid-value</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-})
+def section(title):
+    """Start a new group of fixtures, printed under title when built."""
+    FIXTURE_GROUPS.append((title, []))
 
-# FXL-002: rendition-orientation invalid value
-create_fixture("fxl-rendition-orientation-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="rendition:orientation">diagonal</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-})
 
-# FXL-003: rendition-spread invalid value
-create_fixture("fxl-rendition-spread-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="rendition:spread">diagonal</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-})
+def fixture(name, files, base="epub3"):
+    """Declare an invalid fixture: files merged over the base defaults."""
+    FIXTURES[name] = ("invalid", files, base)
+    FIXTURE_GROUPS[-1][1].append(name)
 
-# FXL-004: spine itemref with invalid rendition:layout property
-create_fixture("fxl-spine-layout-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1" properties="rendition:layout-invalid"/>
-  </spine>
-</package>""",
-})
 
-# FXL-005: spine itemref with invalid spread property
-create_fixture("fxl-spine-spread-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1" properties="rendition:spread-bogus"/>
-  </spine>
-</package>""",
-})
+def valid_fixture(name, files, base="epub3"):
+    """Declare a valid fixture: files merged over the base defaults."""
+    FIXTURES[name] = ("valid", files, base)
+    FIXTURE_GROUPS[-1][1].append(name)
 
 
-# ============================================================================
-# Image Validation Checks
-# ============================================================================
-print("\n=== Image Validation Checks ===")
+def create_fixture(name):
+    """Write fixture name to fixtures/src/<category>/<name>.
 
-# MED-001: Image media type wrong in manifest (declare PNG as JPEG)
-create_fixture("image-media-type-wrong", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="img1" href="cover.png" media-type="image/jpeg"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p><img src="cover.png" alt="Cover"/></p>
-</body>
-</html>""",
-    # Minimal 1x1 white PNG
-    "OEBPS/cover.png": b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82',
+    Returns the status line to print for it.
+    """
+    category, files, base = FIXTURES[name]
+    defaults = DEFAULTS_BYTES if base == "epub3" else EPUB2_DEFAULTS_BYTES
+    fixture_dir = os.path.join(FIXTURES_SRC, category, name)
+
+    merged = dict(defaults)
+    merged.update(encode_files(files))
+
+    if write_fixture(fixture_dir, merged):
+        return f"  Created: {fixture_dir}"
+    return f"  Unchanged: {fixture_dir}"
+
+
+# ============================================================================
+# CSS Validation Checks
+# ============================================================================
+section("CSS Validation Checks")
+
+# Package and chapter with style.css declared and linked
+STYLED_OPF = build_opf(manifest=[NAV_ITEM, CHAPTER1_ITEM, CSS_ITEM])
+STYLED_CHAPTER1 = build_xhtml(head=[STYLESHEET_LINK])
+
+# Chapter whose paragraph carries the class the stylesheet decorates
+DECORATED_CHAPTER1 = build_xhtml(body=['<p class="decorated">Hello, world.</p>'],
+                                 head=[STYLESHEET_LINK])
+
+# (name, style.css, extra files) for fixtures layered over STYLED_OPF and
+# STYLED_CHAPTER1; extra files are added or override those two.
+CSS_CASES = [
+    # CSS-001: css-well-formed - CSS file with syntax errors
+    ("css-syntax-error", "body { color: ; }\np { font-size }\n", {}),
+    # CSS-002: css-invalid-property - CSS with invalid property name
+    ("css-invalid-property", "body { fake-property: 10px; }\n", {}),
+    # CSS-003: css-font-face-missing-src - @font-face without src
+    ("css-font-face-no-src",
+     "@font-face {\n  font-family: 'MyFont';\n  font-weight: normal;\n}\nbody { font-family: 'MyFont'; }\n", {}),
+    # CSS-004: css-font-face-remote-src - @font-face with remote URL
+    ("css-font-face-remote",
+     "@font-face {\n  font-family: 'RemoteFont';\n  src: url('https://example.com/font.woff2');\n}\nbody { font-family: 'RemoteFont'; }\n", {}),
+    # CSS-005: css-import-not-allowed - @import in EPUB CSS
+    ("css-import", "@import url('other.css');\nbody { color: black; }\n", {
+        "OEBPS/content.opf": build_opf(manifest=[
+            NAV_ITEM,
+            CHAPTER1_ITEM,
+            CSS_ITEM,
+            '<item id="css2" href="other.css" media-type="text/css"/>',
+        ]),
+        "OEBPS/other.css": "p { color: blue; }\n",
+    }),
+    # CSS-006: css-font-face-bad-src - @font-face src pointing to nonexistent file
+    ("css-font-face-missing-file",
+     "@font-face {\n  font-family: 'MyFont';\n  src: url('fonts/nonexistent.woff');\n}\nbody { font-family: 'MyFont'; }\n", {}),
+    # CSS-007: css-background-image-missing - CSS background-image pointing to missing file
+    ("css-background-image-missing", ".decorated { background-image: url('images/nonexistent.png'); }\n", {
+        "OEBPS/chapter1.xhtml": DECORATED_CHAPTER1,
+    }),
+    # CSS-008: css-resource-not-in-manifest - CSS references resource not in manifest
+    ("css-resource-not-in-manifest", ".decorated { background-image: url('bg.png'); }\n", {
+        "OEBPS/chapter1.xhtml": DECORATED_CHAPTER1,
+        # Create a real image file but don't put it in manifest
+        "OEBPS/bg.png": MINIMAL_PNG,
+    }),
+]
+
+for name, css, extra_files in CSS_CASES:
+    fixture(name, {
+        "OEBPS/content.opf": STYLED_OPF,
+        "OEBPS/chapter1.xhtml": STYLED_CHAPTER1,
+        "OEBPS/style.css": css,
+        **extra_files,
+    })
+
+
+# ============================================================================
+# Fixed-Layout Enhancement Checks
+# ============================================================================
+section("Fixed-Layout Enhancement Checks")
+
+# (name, build_opf arguments) for fixtures that differ from the default
+# package by one rendition property
+FXL_CASES = [
+    # FXL-001: rendition-layout in metadata
+    ("fxl-rendition-layout-invalid", {"meta": [
+        '<meta property="rendition:layout">invalid-value</meta>',
+    ]}),
+    # FXL-002: rendition-orientation invalid value
+    ("fxl-rendition-orientation-invalid", {"meta": [
+        '<meta property="rendition:orientation">diagonal</meta>',
+    ]}),
+    # FXL-003: rendition-spread invalid value
+    ("fxl-rendition-spread-invalid", {"meta": [
+        '<meta property="rendition:spread">diagonal</meta>',
+    ]}),
+    # FXL-004: spine itemref with invalid rendition:layout property
+    ("fxl-spine-layout-invalid", {"spine": [
+        '<itemref idref="chapter1" properties="rendition:layout-invalid"/>',
+    ]}),
+    # FXL-005: spine itemref with invalid spread property
+    ("fxl-spine-spread-invalid", {"spine": [
+        '<itemref idref="chapter1" properties="rendition:spread-bogus"/>',
+    ]}),
+]
+
+for name, opf_args in FXL_CASES:
+    fixture(name, {"OEBPS/content.opf": build_opf(**opf_args)})
+
+# ============================================================================
+# Image Validation Checks
+# ============================================================================
+section("Image Validation Checks")
+
+# MED-001: Image media type wrong in manifest (declare PNG as JPEG)
+fixture("image-media-type-wrong", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        CHAPTER1_ITEM,
+        '<item id="img1" href="cover.png" media-type="image/jpeg"/>',
+    ]),
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<p><img src="cover.png" alt="Cover"/></p>',
+    ]),
+    "OEBPS/cover.png": MINIMAL_PNG,
 })
 
 # MED-002: Non-core-media-type image without fallback
-create_fixture("image-non-core-media-type", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="img1" href="image.webp" media-type="image/webp"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p><img src="image.webp" alt="Photo"/></p>
-</body>
-</html>""",
-    # Just a stub file - webp content doesn't matter for the check
-    "OEBPS/image.webp": b'RIFF\x00\x00\x00\x00WEBP',
+fixture("image-non-core-media-type", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        CHAPTER1_ITEM,
+        '<item id="img1" href="image.webp" media-type="image/webp"/>',
+    ]),
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<p><img src="image.webp" alt="Photo"/></p>',
+    ]),
+    "OEBPS/image.webp": STUB_WEBP,
 })
 
 # MED-003: Corrupted image file (invalid PNG header)
-create_fixture("image-corrupted", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="img1" href="cover.png" media-type="image/png"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p><img src="cover.png" alt="Cover"/></p>
-</body>
-</html>""",
+fixture("image-corrupted", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        CHAPTER1_ITEM,
+        '<item id="img1" href="cover.png" media-type="image/png"/>',
+    ]),
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<p><img src="cover.png" alt="Cover"/></p>',
+    ]),
     # Not a valid PNG - just garbage data with PNG extension
     "OEBPS/cover.png": b'NOT A VALID PNG FILE AT ALL',
 })
 
 # MED-004: SVG content document with wrong media type
-create_fixture("svg-wrong-media-type", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="img1" href="drawing.svg" media-type="text/xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p><img src="drawing.svg" alt="Drawing"/></p>
-</body>
-</html>""",
+fixture("svg-wrong-media-type", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        CHAPTER1_ITEM,
+        '<item id="img1" href="drawing.svg" media-type="text/xml"/>',
+    ]),
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<p><img src="drawing.svg" alt="Drawing"/></p>',
+    ]),
     "OEBPS/drawing.svg": """<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">
   <circle cx="50" cy="50" r="40" fill="red"/>
@@ -683,51 +228,32 @@ create_fixture("svg-wrong-media-type", {
 })
 
 # MED-005: Audio file not a core media type
-create_fixture("audio-non-core-media-type", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="audio1" href="clip.wav" media-type="audio/wav"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p><audio src="clip.wav">Audio</audio></p>
-</body>
-</html>""",
-    # Minimal WAV header
-    "OEBPS/clip.wav": b'RIFF$\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00D\xac\x00\x00\x88X\x01\x00\x02\x00\x10\x00data\x00\x00\x00\x00',
+fixture("audio-non-core-media-type", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        CHAPTER1_ITEM,
+        '<item id="audio1" href="clip.wav" media-type="audio/wav"/>',
+    ]),
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<p><audio src="clip.wav">Audio</audio></p>',
+    ]),
+    "OEBPS/clip.wav": MINIMAL_WAV,
 })
 
 
 # ============================================================================
 # Encoding / Character Checks
 # ============================================================================
-print("\n=== Encoding Checks ===")
+section("Encoding Checks")
 
 # ENC-001: Non-UTF-8 XHTML file (Latin-1 encoding)
-create_fixture("content-non-utf8-encoding", {
+fixture("content-non-utf8-encoding", {
     "OEBPS/chapter1.xhtml": b'<?xml version="1.0" encoding="ISO-8859-1"?>\n<!DOCTYPE html>\n<html xmlns="http://www.w3.org/1999/xhtml">\n<head><title>Chapter 1</title></head>\n<body>\n  <h1>Chapter 1</h1>\n  <p>Caf\xe9</p>\n</body>\n</html>\n',
 })
 
 # ENC-002: BOM in XHTML file (valid but should be warned about sometimes)
 # Actually UTF-8 BOM is generally accepted - let's try UTF-16 instead
-create_fixture("content-utf16-encoding", {
+fixture("content-utf16-encoding", {
     "OEBPS/chapter1.xhtml": '<?xml version="1.0" encoding="UTF-16"?>\n<!DOCTYPE html>\n<html xmlns="http://www.w3.org/1999/xhtml">\n<head><title>Chapter 1</title></head>\n<body>\n  <h1>Chapter 1</h1>\n  <p>Hello, world.</p>\n</body>\n</html>\n'.encode('utf-16'),
 })
 
@@ -735,17 +261,17 @@ create_fixture("content-utf16-encoding", {
 # ============================================================================
 # Additional OPF Checks
 # ============================================================================
-print("\n=== Additional OPF Checks ===")
+section("Additional OPF Checks")
 
 # OPF-027: Missing unique-identifier attribute on package element
-create_fixture("opf-no-unique-id-attr", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("opf-no-unique-id-attr", {
+    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="3.0">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
+    <dc:identifier id="uid">{BOOK_ID}</dc:identifier>
     <dc:title>Test Book</dc:title>
     <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
+    <meta property="dcterms:modified">{MODIFIED}</meta>
   </metadata>
   <manifest>
     <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
@@ -758,76 +284,38 @@ create_fixture("opf-no-unique-id-attr", {
 })
 
 # OPF-028: Duplicate meta property dcterms:modified
-create_fixture("opf-duplicate-dcterms-modified", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="dcterms:modified">2025-02-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("opf-duplicate-dcterms-modified", {
+    "OEBPS/content.opf": build_opf(meta=[
+        '<meta property="dcterms:modified">2025-02-01T00:00:00Z</meta>',
+    ]),
 })
 
 # OPF-029: Manifest item with invalid properties value
-create_fixture("opf-manifest-invalid-property", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" properties="fake-property"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("opf-manifest-invalid-property", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" properties="fake-property"/>',
+    ]),
 })
 
 # OPF-030: Manifest item with empty href
-create_fixture("opf-manifest-href-empty", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="extra" href="" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("opf-manifest-href-empty", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        CHAPTER1_ITEM,
+        '<item id="extra" href="" media-type="application/xhtml+xml"/>',
+    ]),
 })
 
 # OPF-031: dc:identifier with empty value
-create_fixture("opf-dc-identifier-empty", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("opf-dc-identifier-empty", {
+    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
     <dc:identifier id="uid"></dc:identifier>
     <dc:title>Test Book</dc:title>
     <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
+    <meta property="dcterms:modified">{MODIFIED}</meta>
   </metadata>
   <manifest>
     <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
@@ -840,14 +328,14 @@ create_fixture("opf-dc-identifier-empty", {
 })
 
 # OPF-032: dc:title with empty value
-create_fixture("opf-dc-title-empty", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("opf-dc-title-empty", {
+    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
+    <dc:identifier id="uid">{BOOK_ID}</dc:identifier>
     <dc:title></dc:title>
     <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
+    <meta property="dcterms:modified">{MODIFIED}</meta>
   </metadata>
   <manifest>
     <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
@@ -860,34 +348,22 @@ create_fixture("opf-dc-title-empty", {
 })
 
 # OPF-033: Manifest item href with fragment
-create_fixture("opf-manifest-href-fragment", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml#section1" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("opf-manifest-href-fragment", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="chapter1.xhtml#section1" media-type="application/xhtml+xml"/>',
+    ]),
 })
 
 # OPF-034: Package with dir attribute having invalid value
-create_fixture("opf-package-dir-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("opf-package-dir-invalid", {
+    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid" dir="up">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
+    <dc:identifier id="uid">{BOOK_ID}</dc:identifier>
     <dc:title>Test Book</dc:title>
     <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
+    <meta property="dcterms:modified">{MODIFIED}</meta>
   </metadata>
   <manifest>
     <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
@@ -903,10 +379,10 @@ create_fixture("opf-package-dir-invalid", {
 # ============================================================================
 # Additional Content Document Checks
 # ============================================================================
-print("\n=== Additional Content Document Checks ===")
+section("Additional Content Document Checks")
 
 # HTM-015: EPUB type attribute with unknown value
-create_fixture("content-epub-type-invalid", {
+fixture("content-epub-type-invalid", {
     "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
@@ -921,7 +397,7 @@ create_fixture("content-epub-type-invalid", {
 })
 
 # HTM-016: HTML with duplicate IDs
-create_fixture("content-duplicate-ids", {
+fixture("content-duplicate-ids", {
     "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml">
@@ -934,20 +410,14 @@ create_fixture("content-duplicate-ids", {
 })
 
 # HTM-017: XHTML with entity reference not defined in XML
-create_fixture("content-html-entity", {
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Copyright &copy; 2025</p>
-</body>
-</html>""",
+fixture("content-html-entity", {
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<p>Copyright &copy; 2025</p>',
+    ]),
 })
 
 # HTM-018: Multiple body elements
-create_fixture("content-multiple-body", {
+fixture("content-multiple-body", {
     "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml">
@@ -963,7 +433,7 @@ create_fixture("content-multiple-body", {
 })
 
 # HTM-019: Missing html root element (just body)
-create_fixture("content-no-html-element", {
+fixture("content-no-html-element", {
     "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <body xmlns="http://www.w3.org/1999/xhtml">
@@ -973,7 +443,7 @@ create_fixture("content-no-html-element", {
 })
 
 # HTM-020: SSI or processing instruction in content
-create_fixture("content-processing-instruction", {
+fixture("content-processing-instruction", {
     "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <?xml-stylesheet type="text/css" href="style.css"?>
 <!DOCTYPE html>
@@ -987,55 +457,37 @@ create_fixture("content-processing-instruction", {
 })
 
 # HTM-021: Inline style with position:absolute (restricted in some reading systems)
-create_fixture("content-style-position-absolute", {
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <div style="position:absolute; top:0; left:0;">
-    <p>Absolutely positioned content.</p>
-  </div>
-</body>
-</html>""",
+fixture("content-style-position-absolute", {
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<div style="position:absolute; top:0; left:0;">',
+        '  <p>Absolutely positioned content.</p>',
+        '</div>',
+    ]),
 })
 
 # HTM-022: Object element without fallback
-create_fixture("content-object-no-fallback", {
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <object data="widget.swf" type="application/x-shockwave-flash"/>
-</body>
-</html>""",
+fixture("content-object-no-fallback", {
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<object data="widget.swf" type="application/x-shockwave-flash"/>',
+    ]),
 })
 
 # HTM-023: Link to file outside container with relative path
-create_fixture("content-link-parent-dir", {
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p><a href="../../outside.xhtml">Link outside container</a></p>
-</body>
-</html>""",
+fixture("content-link-parent-dir", {
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<p><a href="../../outside.xhtml">Link outside container</a></p>',
+    ]),
 })
 
 
 # ============================================================================
 # Navigation Edge Cases
 # ============================================================================
-print("\n=== Navigation Edge Cases ===")
+section("Navigation Edge Cases")
 
 # NAV-008: Nav with nested ordered list depth > spec rec
 # Actually let's test nav with non-ol content
-create_fixture("nav-toc-no-ol", {
+fixture("nav-toc-no-ol", {
     "OEBPS/nav.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
@@ -1052,7 +504,7 @@ create_fixture("nav-toc-no-ol", {
 })
 
 # NAV-009: Nav hidden attribute usage
-create_fixture("nav-hidden-attribute", {
+fixture("nav-hidden-attribute", {
     "OEBPS/nav.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
@@ -1069,7 +521,7 @@ create_fixture("nav-hidden-attribute", {
 })
 
 # NAV-010: landmarks with invalid epub:type
-create_fixture("nav-landmarks-invalid-type", {
+fixture("nav-landmarks-invalid-type", {
     "OEBPS/nav.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
@@ -1092,7 +544,7 @@ create_fixture("nav-landmarks-invalid-type", {
 })
 
 # NAV-011: Nav document not well-formed
-create_fixture("nav-malformed-xhtml", {
+fixture("nav-malformed-xhtml", {
     "OEBPS/nav.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
@@ -1112,14 +564,14 @@ create_fixture("nav-malformed-xhtml", {
 # ============================================================================
 # Full EPUB 2 Support
 # ============================================================================
-print("\n=== Full EPUB 2 Support ===")
+section("Full EPUB 2 Support")
 
 # E2-005: EPUB 2 with EPUB 3 features (nav property)
-create_fixture("epub2-with-nav-property", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("epub2-with-nav-property", {
+    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="uid">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
+    <dc:identifier id="uid">{BOOK_ID}</dc:identifier>
     <dc:title>Test Book</dc:title>
     <dc:language>en</dc:language>
   </metadata>
@@ -1135,14 +587,14 @@ create_fixture("epub2-with-nav-property", {
 }, base="epub2")
 
 # E2-006: EPUB 2 with dcterms:modified (EPUB 3 only)
-create_fixture("epub2-with-dcterms-modified", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("epub2-with-dcterms-modified", {
+    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="uid">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
+    <dc:identifier id="uid">{BOOK_ID}</dc:identifier>
     <dc:title>Test Book</dc:title>
     <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
+    <meta property="dcterms:modified">{MODIFIED}</meta>
   </metadata>
   <manifest>
     <item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>
@@ -1155,11 +607,11 @@ create_fixture("epub2-with-dcterms-modified", {
 }, base="epub2")
 
 # E2-007: EPUB 2 NCX navPoint with no content src
-create_fixture("epub2-ncx-navpoint-no-content", {
-    "OEBPS/toc.ncx": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("epub2-ncx-navpoint-no-content", {
+    "OEBPS/toc.ncx": f"""<?xml version="1.0" encoding="UTF-8"?>
 <ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
   <head>
-    <meta name="dtb:uid" content="urn:uuid:12345678-1234-1234-1234-123456789012"/>
+    <meta name="dtb:uid" content="{BOOK_ID}"/>
     <meta name="dtb:depth" content="1"/>
     <meta name="dtb:totalPageCount" content="0"/>
     <meta name="dtb:maxPageNumber" content="0"/>
@@ -1174,11 +626,11 @@ create_fixture("epub2-ncx-navpoint-no-content", {
 }, base="epub2")
 
 # E2-008: EPUB 2 NCX navPoint pointing to nonexistent file
-create_fixture("epub2-ncx-broken-content-src", {
-    "OEBPS/toc.ncx": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("epub2-ncx-broken-content-src", {
+    "OEBPS/toc.ncx": f"""<?xml version="1.0" encoding="UTF-8"?>
 <ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
   <head>
-    <meta name="dtb:uid" content="urn:uuid:12345678-1234-1234-1234-123456789012"/>
+    <meta name="dtb:uid" content="{BOOK_ID}"/>
     <meta name="dtb:depth" content="1"/>
     <meta name="dtb:totalPageCount" content="0"/>
     <meta name="dtb:maxPageNumber" content="0"/>
@@ -1194,11 +646,11 @@ create_fixture("epub2-ncx-broken-content-src", {
 }, base="epub2")
 
 # E2-009: EPUB 2 with guide element referencing nonexistent file
-create_fixture("epub2-guide-broken-href", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("epub2-guide-broken-href", {
+    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="uid">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
+    <dc:identifier id="uid">{BOOK_ID}</dc:identifier>
     <dc:title>Test Book</dc:title>
     <dc:language>en</dc:language>
   </metadata>
@@ -1216,7 +668,7 @@ create_fixture("epub2-guide-broken-href", {
 }, base="epub2")
 
 # E2-010: EPUB 2 NCX uid mismatch with OPF identifier
-create_fixture("epub2-ncx-uid-mismatch", {
+fixture("epub2-ncx-uid-mismatch", {
     "OEBPS/toc.ncx": """<?xml version="1.0" encoding="UTF-8"?>
 <ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
   <head>
@@ -1236,11 +688,11 @@ create_fixture("epub2-ncx-uid-mismatch", {
 }, base="epub2")
 
 # E2-011: EPUB 2 NCX with duplicate navPoint IDs
-create_fixture("epub2-ncx-duplicate-ids", {
-    "OEBPS/toc.ncx": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("epub2-ncx-duplicate-ids", {
+    "OEBPS/toc.ncx": f"""<?xml version="1.0" encoding="UTF-8"?>
 <ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
   <head>
-    <meta name="dtb:uid" content="urn:uuid:12345678-1234-1234-1234-123456789012"/>
+    <meta name="dtb:uid" content="{BOOK_ID}"/>
     <meta name="dtb:depth" content="1"/>
     <meta name="dtb:totalPageCount" content="0"/>
     <meta name="dtb:maxPageNumber" content="0"/>
@@ -1263,67 +715,31 @@ create_fixture("epub2-ncx-duplicate-ids", {
 # ============================================================================
 # Additional Resource Reference Checks
 # ============================================================================
-print("\n=== Additional Resource Checks ===")
+section("Additional Resource Checks")
 
 # RSC-010: Manifest href with percent-encoding issue
-create_fixture("manifest-href-bad-encoding", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter%XX.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("manifest-href-bad-encoding", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="chapter%XX.xhtml" media-type="application/xhtml+xml"/>',
+    ]),
 })
 
 # RSC-011: Manifest references file outside OEBPS (path traversal)
-create_fixture("manifest-path-traversal", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="../outside.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("manifest-path-traversal", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="../outside.xhtml" media-type="application/xhtml+xml"/>',
+    ]),
 })
 
 # RSC-012: Duplicate file entries (same path, different case on case-sensitive FS)
-create_fixture("manifest-duplicate-item-same-resource", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="chapter1dup" href="Chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("manifest-duplicate-item-same-resource", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        CHAPTER1_ITEM,
+        '<item id="chapter1dup" href="Chapter1.xhtml" media-type="application/xhtml+xml"/>',
+    ]),
     "OEBPS/Chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml">
@@ -1339,17 +755,17 @@ create_fixture("manifest-duplicate-item-same-resource", {
 # ============================================================================
 # Container / Package Edge Cases
 # ============================================================================
-print("\n=== Container Edge Cases ===")
+section("Container Edge Cases")
 
 # OCF-010: META-INF directory contains extra files (signatures.xml etc.)
-create_fixture("ocf-metainf-extra-files", {
+fixture("ocf-metainf-extra-files", {
     "META-INF/encryption.xml": """<?xml version="1.0" encoding="UTF-8"?>
 <encryption xmlns="urn:oasis:names:tc:opendocument:xmlns:container" xmlns:enc="http://www.w3.org/2001/04/xmlenc#">
 </encryption>""",
 })
 
 # OCF-011: Container with multiple rootfiles
-create_fixture("ocf-container-multiple-rootfiles", {
+fixture("ocf-container-multiple-rootfiles", {
     "META-INF/container.xml": """<?xml version="1.0" encoding="UTF-8"?>
 <container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
   <rootfiles>
@@ -1360,27 +776,15 @@ create_fixture("ocf-container-multiple-rootfiles", {
 })
 
 # OCF-012: File with absolute path in manifest
-create_fixture("manifest-absolute-path", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="/OEBPS/chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("manifest-absolute-path", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="/OEBPS/chapter1.xhtml" media-type="application/xhtml+xml"/>',
+    ]),
 })
 
 # OCF-013: Container rootfile with wrong media-type
-create_fixture("ocf-container-wrong-rootfile-mediatype", {
+fixture("ocf-container-wrong-rootfile-mediatype", {
     "META-INF/container.xml": """<?xml version="1.0" encoding="UTF-8"?>
 <container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
   <rootfiles>
@@ -1393,17 +797,17 @@ create_fixture("ocf-container-wrong-rootfile-mediatype", {
 # ============================================================================
 # Valid Fixtures for Level 3
 # ============================================================================
-print("\n=== Valid Fixtures ===")
+section("Valid Fixtures")
 
 # valid-fxl-epub3 - a valid fixed-layout EPUB 3
-create_valid_fixture("fxl-epub3", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
+valid_fixture("fxl-epub3", {
+    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
+    <dc:identifier id="uid">{BOOK_ID}</dc:identifier>
     <dc:title>FXL Test Book</dc:title>
     <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
+    <meta property="dcterms:modified">{MODIFIED}</meta>
     <meta property="rendition:layout">pre-paginated</meta>
     <meta property="rendition:orientation">auto</meta>
     <meta property="rendition:spread">auto</meta>
@@ -1416,29 +820,20 @@ create_valid_fixture("fxl-epub3", {
     <itemref idref="chapter1"/>
   </spine>
 </package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <meta name="viewport" content="width=600, height=800"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
+    "OEBPS/chapter1.xhtml": build_xhtml(head=[
+        '<meta name="viewport" content="width=600, height=800"/>',
+    ]),
 })
 
 # valid-with-css - a valid EPUB with CSS
-create_valid_fixture("epub3-with-css", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
+valid_fixture("epub3-with-css", {
+    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
+    <dc:identifier id="uid">{BOOK_ID}</dc:identifier>
     <dc:title>Test Book with CSS</dc:title>
     <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
+    <meta property="dcterms:modified">{MODIFIED}</meta>
   </metadata>
   <manifest>
     <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
@@ -1449,20 +844,44 @@ create_valid_fixture("epub3-with-css", {
     <itemref idref="chapter1"/>
   </spine>
 </package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <link rel="stylesheet" type="text/css" href="style.css"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
+    "OEBPS/chapter1.xhtml": STYLED_CHAPTER1,
     "OEBPS/style.css": "body { margin: 1em; font-family: serif; }\nh1 { color: #333; }\np { line-height: 1.5; }\n",
 })
 
 
-print(f"\nDone! Created Level 3 fixtures.")
+# ============================================================================
+# Main
+# ============================================================================
+
+def build_all(names=None, parallel=True):
+    """Write the declared fixtures, section by section.
+
+    names limits the build to those fixtures; by default every fixture is
+    written. Each fixture owns its directory and the work is file I/O, so
+    with parallel=True each section runs on a thread pool; the status lines
+    are printed in declaration order either way.
+    """
+    check_fixture_names(names, FIXTURES)
+
+    executor = concurrent.futures.ThreadPoolExecutor() if parallel else None
+    try:
+        for title, group in FIXTURE_GROUPS:
+            if names is not None:
+                group = [name for name in group if name in names]
+                if not group:
+                    continue
+            if executor is None:
+                lines = map(create_fixture, group)
+            else:
+                lines = executor.map(create_fixture, group)
+            # Header and status lines go out in one write per section.
+            print("\n".join([f"\n=== {title} ===", *lines]), flush=True)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+if __name__ == "__main__":
+    # Optional fixture names on the command line rebuild just those.
+    build_all(sys.argv[1:] or None)
+    print(f"\nDone! Created Level 3 fixtures.")
@@ -3,12 +3,23 @@
 
 Based on analysis of epubcheck 5.3.0 reference output.
 """
-import json
+import concurrent.futures
 import os
 
+from expectedlib import json_dumps, load_reference
+
 EXPECTED_DIR = "expected"
 REFERENCE_DIR = "reference"
 
+# (fatal_count, error_count, warning_count) expected from a single message
+# of each severity, used when there is no reference output to count from
+SEVERITY_COUNTS = {
+    "FATAL": (1, 0, 0),
+    "ERROR": (0, 1, 0),
+    "WARNING": (0, 0, 1),
+    "USAGE": (0, 0, 0),
+}
+
 # Level 4 check definitions
 # Format: fixture_name -> {check_id, epubcheck_id, severity, message_pattern, ...}
 # Special keys:
@@ -302,11 +313,12 @@ LEVEL4_CHECKS = {
 
 
 def create_expected(fixture_name, check_info, category="invalid"):
-    """Create expected JSON file for a fixture."""
+    """Create expected JSON file for a fixture.
+
+    The expected/<category> directory must already exist.
+    """
     fixture_path = f"{category}/{fixture_name}"
-    out_dir = os.path.join(EXPECTED_DIR, category)
-    os.makedirs(out_dir, exist_ok=True)
-    out_file = os.path.join(out_dir, f"{fixture_name}.json")
+    out_file = os.path.join(EXPECTED_DIR, category, f"{fixture_name}.json")
 
     if check_info.get("valid_override"):
         # Fixture where epubcheck doesn't flag the issue
@@ -322,31 +334,21 @@ def create_expected(fixture_name, check_info, category="invalid"):
         }
     else:
         severity = check_info["severity"]
-        fatal_count = 1 if severity == "FATAL" else 0
-        error_count = 0 if severity in ("FATAL", "WARNING", "USAGE") else 1
-        warning_count = 1 if severity == "WARNING" else 0
+        fatal_count, error_count, warning_count = SEVERITY_COUNTS[severity]
 
         # Read reference to get actual counts
         ref_path = os.path.join(REFERENCE_DIR, category, f"{fixture_name}.json")
         error_count_min = None
-        if os.path.exists(ref_path):
-            with open(ref_path) as f:
-                ref = json.load(f)
+        ref = load_reference(ref_path)
+        if ref is not None:
             ref_fatals = ref["checker"]["nFatal"]
             ref_errors = ref["checker"]["nError"]
             ref_warnings = ref["checker"]["nWarning"]
 
             if severity == "FATAL":
                 fatal_count = ref_fatals
-                error_count = ref_errors
-            elif severity == "WARNING":
-                error_count = ref_errors
-                warning_count = ref_warnings
-            else:
-                error_count = ref_errors
-
-            if not warning_count and severity != "WARNING":
-                warning_count = ref_warnings
+            error_count = ref_errors
+            warning_count = ref_warnings
 
             # Use error_count_min if there are more errors than expected from single defect
             if check_info.get("error_count_min"):
@@ -373,18 +375,18 @@ def create_expected(fixture_name, check_info, category="invalid"):
             "warning_count": warning_count,
         }
 
-    with open(out_file, 'w') as f:
-        json.dump(expected, f, indent=2)
-        f.write('\n')
+    with open(out_file, 'wb') as f:
+        f.write(json_dumps(expected))
 
-    print(f"  Created: {out_file}")
+    return out_file
 
 
 def create_valid_expected(fixture_name):
-    """Create expected JSON file for a valid fixture."""
-    out_dir = os.path.join(EXPECTED_DIR, "valid")
-    os.makedirs(out_dir, exist_ok=True)
-    out_file = os.path.join(out_dir, f"{fixture_name}.json")
+    """Create expected JSON file for a valid fixture.
+
+    The expected/valid directory must already exist.
+    """
+    out_file = os.path.join(EXPECTED_DIR, "valid", f"{fixture_name}.json")
 
     expected = {
         "fixture": f"valid/{fixture_name}",
@@ -396,17 +398,24 @@ def create_valid_expected(fixture_name):
         "warning_count": 0,
     }
 
-    with open(out_file, 'w') as f:
-        json.dump(expected, f, indent=2)
-        f.write('\n')
+    with open(out_file, 'wb') as f:
+        f.write(json_dumps(expected))
 
-    print(f"  Created: {out_file}")
+    return out_file
 
 
 if __name__ == "__main__":
     print("Creating Level 4 expected output files...\n")
 
-    for fixture_name, check_info in sorted(LEVEL4_CHECKS.items()):
-        create_expected(fixture_name, check_info)
+    for category in ("invalid", "valid"):
+        os.makedirs(os.path.join(EXPECTED_DIR, category), exist_ok=True)
+
+    # Each fixture reads its own reference file and writes its own expected
+    # file, so the I/O-bound work runs on a thread pool; results come back
+    # in submission order and are printed with a single write.
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        out_files = executor.map(lambda item: create_expected(*item),
+                                 sorted(LEVEL4_CHECKS.items()))
+        print("\n".join(f"  Created: {out_file}" for out_file in out_files))
 
     print(f"\nDone! Created {len(LEVEL4_CHECKS)} expected files.")
@@ -5,379 +5,162 @@ Level 4 — "Full conformance" (~170+ checks total, ~46 new)
 Covers: Advanced OPF/metadata, deep content validation, accessibility,
 media overlays, container edge cases, advanced EPUB 2.
 """
+import concurrent.futures
 import os
-import shutil
+import sys
+import xml.etree.ElementTree as ET
+
+from fixturelib import (
+    BOOK_ID, CHAPTER1_ITEM, DEFAULTS_BYTES, EPUB2_DEFAULTS_BYTES, FIXTURES_SRC, NAV_ITEM,
+    NAV_XHTML, build_opf, build_xhtml, check_fixture_names, encode_files, write_fixture,
+)
 
-FIXTURES_SRC = "fixtures/src"
 BASE_EPUB3 = os.path.join(FIXTURES_SRC, "valid", "minimal-epub3")
 BASE_EPUB2 = os.path.join(FIXTURES_SRC, "valid", "minimal-epub2")
 
-# Default file contents for minimal-epub3
-DEFAULTS = {
-    "mimetype": "application/epub+zip",
-    "META-INF/container.xml": """<?xml version="1.0" encoding="UTF-8"?>
-<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
-  <rootfiles>
-    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
-  </rootfiles>
-</container>""",
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/nav.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
-<head><title>Navigation</title></head>
-<body>
-  <nav epub:type="toc">
-    <h1>Table of Contents</h1>
-    <ol>
-      <li><a href="chapter1.xhtml">Chapter 1</a></li>
-    </ol>
-  </nav>
-</body>
-</html>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
-}
+# Package prefix the accessibility fixtures declare for schema.org metadata
+SCHEMA_PREFIX = "schema: http://schema.org/"
 
-EPUB2_DEFAULTS = {
-    "mimetype": "application/epub+zip",
-    "META-INF/container.xml": DEFAULTS["META-INF/container.xml"],
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-  </metadata>
-  <manifest>
-    <item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine toc="ncx">
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/toc.ncx": """<?xml version="1.0" encoding="UTF-8"?>
-<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
-  <head>
-    <meta name="dtb:uid" content="urn:uuid:12345678-1234-1234-1234-123456789012"/>
-    <meta name="dtb:depth" content="1"/>
-    <meta name="dtb:totalPageCount" content="0"/>
-    <meta name="dtb:maxPageNumber" content="0"/>
-  </head>
-  <docTitle><text>Test Book</text></docTitle>
-  <navMap>
-    <navPoint id="np-1" playOrder="1">
-      <navLabel><text>Chapter 1</text></navLabel>
-      <content src="chapter1.xhtml"/>
-    </navPoint>
-  </navMap>
-</ncx>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
+# XML documents a fixture may carry, and the (fixture, path) of each one
+# whose defect is that the document is not well-formed
+XML_SUFFIXES = (".opf", ".xhtml", ".ncx", ".smil", ".svg", ".xml")
+MALFORMED_DOCUMENTS = {
+    ("content-svg-malformed", "OEBPS/chapter1.xhtml"),
+    ("media-overlay-malformed", "OEBPS/chapter1.smil"),
+    ("ocf-encryption-malformed", "META-INF/encryption.xml"),
 }
 
 
-def create_fixture(name, files, base="epub3"):
-    """Create fixture directory with given files merged over defaults."""
-    defaults = DEFAULTS if base == "epub3" else EPUB2_DEFAULTS
-    fixture_dir = os.path.join(FIXTURES_SRC, "invalid", name)
-    if os.path.exists(fixture_dir):
-        shutil.rmtree(fixture_dir)
+def check_well_formed(name, files):
+    """Raise ValueError if an XML document in files fails to parse.
 
-    merged = dict(defaults)
-    merged.update(files)
+    Catches template slips that would turn a fixture's targeted defect
+    into a plain XML syntax error. Only the documents listed in
+    MALFORMED_DOCUMENTS are exempt; the rest of those fixtures is checked.
+    """
+    for filepath, content in files.items():
+        if not filepath.endswith(XML_SUFFIXES) or (name, filepath) in MALFORMED_DOCUMENTS:
+            continue
+        try:
+            ET.fromstring(content)
+        except ET.ParseError as e:
+            raise ValueError(f"{name}: {filepath} is not well-formed: {e}") from e
 
-    for filepath, content in merged.items():
-        full_path = os.path.join(fixture_dir, filepath)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        if isinstance(content, bytes):
-            with open(full_path, 'wb') as f:
-                f.write(content)
-        else:
-            with open(full_path, 'w', newline='') as f:
-                f.write(content)
 
-    print(f"  Created: {fixture_dir}")
-    return fixture_dir
+def create_fixture(name):
+    """Write declared fixture name to fixtures/src/<category>/<name>.
 
+    Returns the status line to print for it.
+    """
+    category, files, base = FIXTURES[name]
+    defaults = DEFAULTS_BYTES if base == "epub3" else EPUB2_DEFAULTS_BYTES
+    fixture_dir = os.path.join(FIXTURES_SRC, category, name)
 
-def create_valid_fixture(name, files, base="epub3"):
-    """Create valid fixture directory."""
-    defaults = DEFAULTS if base == "epub3" else EPUB2_DEFAULTS
-    fixture_dir = os.path.join(FIXTURES_SRC, "valid", name)
-    if os.path.exists(fixture_dir):
-        shutil.rmtree(fixture_dir)
+    files = encode_files(files)
+    check_well_formed(name, files)
 
     merged = dict(defaults)
     merged.update(files)
 
-    for filepath, content in merged.items():
-        full_path = os.path.join(fixture_dir, filepath)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        if isinstance(content, bytes):
-            with open(full_path, 'wb') as f:
-                f.write(content)
-        else:
-            with open(full_path, 'w', newline='') as f:
-                f.write(content)
+    if write_fixture(fixture_dir, merged):
+        return f"  Created: {fixture_dir}"
+    return f"  Unchanged: {fixture_dir}"
+
+
+# name -> (category, files, base) for every fixture declared below, and
+# [(batch title, summary, [name, ...])] in declaration order; batch() opens
+# a group and fixture() adds to it. Nothing is written until build_all().
+FIXTURES = {}
+FIXTURE_GROUPS = []
+
+
+def batch(title, summary):
+    """Start a new group of fixtures, printed under title when built."""
+    FIXTURE_GROUPS.append((title, summary, []))
 
-    print(f"  Created: {fixture_dir}")
-    return fixture_dir
+
+def fixture(name, files, base="epub3"):
+    """Declare an invalid fixture: files merged over the base defaults."""
+    FIXTURES[name] = ("invalid", files, base)
+    FIXTURE_GROUPS[-1][2].append(name)
 
 
 # ============================================================================
 # BATCH 1: Advanced OPF & Metadata Checks
 # ============================================================================
-print("\n=== Batch 1: Advanced OPF & Metadata ===")
+batch("Batch 1: Advanced OPF & Metadata", "Batch 1 (Advanced OPF & Metadata)")
 
 # OPF-035: page-progression-direction with invalid value
-create_fixture("opf-ppd-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine page-progression-direction="up">
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("opf-ppd-invalid", {
+    "OEBPS/content.opf": build_opf(spine_attrs=' page-progression-direction="up"'),
 })
 
 # OPF-036: dc:date with invalid format
-create_fixture("opf-dc-date-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <dc:date>not-a-date</dc:date>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("opf-dc-date-invalid", {
+    "OEBPS/content.opf": build_opf(dc=["<dc:date>not-a-date</dc:date>"]),
 })
 
 # OPF-037: meta refines attribute references nonexistent id
-create_fixture("opf-meta-refines-bad-target", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta refines="#nonexistent-id" property="title-type">main</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("opf-meta-refines-bad-target", {
+    "OEBPS/content.opf": build_opf(meta=[
+        '<meta refines="#nonexistent-id" property="title-type">main</meta>',
+    ]),
 })
 
 # OPF-038: spine linear attribute with invalid value
-create_fixture("opf-spine-linear-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1" linear="maybe"/>
-  </spine>
-</package>""",
+fixture("opf-spine-linear-invalid", {
+    "OEBPS/content.opf": build_opf(spine=[
+        '<itemref idref="chapter1" linear="maybe"/>',
+    ]),
 })
 
 # OPF-039: guide element in EPUB 3 (deprecated)
-create_fixture("opf-epub3-guide", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-  <guide>
-    <reference type="toc" title="Table of Contents" href="nav.xhtml"/>
-  </guide>
-</package>""",
+fixture("opf-epub3-guide", {
+    "OEBPS/content.opf": build_opf(guide=[
+        '<reference type="toc" title="Table of Contents" href="nav.xhtml"/>',
+    ]),
 })
 
 # OPF-040: dc:identifier UUID with invalid format
-create_fixture("opf-uuid-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:not-a-valid-uuid</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("opf-uuid-invalid", {
+    "OEBPS/content.opf": build_opf(identifier="urn:uuid:not-a-valid-uuid"),
 })
 
 # OPF-041: spine where all items are non-linear
-create_fixture("opf-spine-all-nonlinear", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1" linear="no"/>
-  </spine>
-</package>""",
+fixture("opf-spine-all-nonlinear", {
+    "OEBPS/content.opf": build_opf(spine=[
+        '<itemref idref="chapter1" linear="no"/>',
+    ]),
 })
 
 # OPF-042: rendition:flow with invalid value
-create_fixture("opf-rendition-flow-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="rendition:flow">invalid-flow</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("opf-rendition-flow-invalid", {
+    "OEBPS/content.opf": build_opf(meta=[
+        '<meta property="rendition:flow">invalid-flow</meta>',
+    ]),
 })
 
 # OPF-043: prefix attribute with invalid syntax
-create_fixture("opf-prefix-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid"
-         prefix="bad prefix syntax :::">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("opf-prefix-invalid", {
+    "OEBPS/content.opf": build_opf(prefix="bad prefix syntax :::"),
 })
 
 # OPF-044: media-overlay attribute referencing nonexistent manifest item
-create_fixture("opf-media-overlay-bad-ref", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="nonexistent-overlay"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("opf-media-overlay-bad-ref", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="nonexistent-overlay"/>',
+    ]),
 })
 
 
-print(f"\nDone! Created Batch 1 (Advanced OPF & Metadata) fixtures.")
-
-
 # ============================================================================
 # BATCH 2: Advanced Content Document Checks
 # ============================================================================
-print("\n=== Batch 2: Advanced Content Documents ===")
+batch("Batch 2: Advanced Content Documents", "Batch 2 (Advanced Content Documents)")
 
 # HTM-024: Content document with no head element
-create_fixture("content-no-head", {
+fixture("content-no-head", {
     "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml">
@@ -389,20 +172,14 @@ create_fixture("content-no-head", {
 })
 
 # HTM-025: embed element in content document
-create_fixture("content-embed-element", {
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <embed src="plugin.swf" type="application/x-shockwave-flash"/>
-</body>
-</html>""",
+fixture("content-embed-element", {
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<embed src="plugin.swf" type="application/x-shockwave-flash"/>',
+    ]),
 })
 
 # HTM-026: lang and xml:lang mismatch
-create_fixture("content-lang-mismatch", {
+fixture("content-lang-mismatch", {
     "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml" lang="en" xml:lang="fr">
@@ -415,109 +192,43 @@ create_fixture("content-lang-mismatch", {
 })
 
 # HTM-027: video element with poster pointing to nonexistent file
-create_fixture("content-video-poster-missing", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <video poster="nonexistent-poster.jpg" src="video.mp4">Video</video>
-</body>
-</html>""",
+fixture("content-video-poster-missing", {
+    "OEBPS/content.opf": build_opf(),
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<video poster="nonexistent-poster.jpg" src="video.mp4">Video</video>',
+    ]),
 })
 
 # HTM-028: audio element with src pointing to nonexistent file
-create_fixture("content-audio-missing", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <audio src="nonexistent-audio.mp3">Audio</audio>
-</body>
-</html>""",
+fixture("content-audio-missing", {
+    "OEBPS/content.opf": build_opf(),
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<audio src="nonexistent-audio.mp3">Audio</audio>',
+    ]),
 })
 
 # HTM-029: Inline SVG that is malformed
-create_fixture("content-svg-malformed", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" properties="svg"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">
-    <rect width="100" height="100" invalid-attr-no-value/>
-  </svg>
-</body>
-</html>""",
+fixture("content-svg-malformed", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" properties="svg"/>',
+    ]),
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">',
+        '  <rect width="100" height="100" invalid-attr-no-value/>',
+        '</svg>',
+    ]),
 })
 
 # HTM-030: img element with empty src attribute
-create_fixture("content-img-empty-src", {
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p><img src="" alt="Empty source"/></p>
-</body>
-</html>""",
+fixture("content-img-empty-src", {
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<p><img src="" alt="Empty source"/></p>',
+    ]),
 })
 
 # HTM-031: SSML namespace used incorrectly
-create_fixture("content-ssml-invalid-ns", {
+fixture("content-ssml-invalid-ns", {
     "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:ssml="http://www.w3.org/2001/10/synthesis-WRONG">
@@ -530,299 +241,125 @@ create_fixture("content-ssml-invalid-ns", {
 })
 
 # HTM-032: inline style element with CSS syntax error
-create_fixture("content-style-syntax-error", {
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <style type="text/css">
-    body { color: ; }
-    p { font-size }
-  </style>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
+fixture("content-style-syntax-error", {
+    "OEBPS/chapter1.xhtml": build_xhtml(head=[
+        '<style type="text/css">',
+        '  body { color: ; }',
+        '  p { font-size }',
+        '</style>',
+    ]),
 })
 
 # HTM-033: RDF metadata in content document
-create_fixture("content-rdf-element", {
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-  <title>Chapter 1</title>
-  <meta name="rdf:about" content="test"/>
-</head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
+fixture("content-rdf-element", {
+    "OEBPS/chapter1.xhtml": build_xhtml(head=[
+        '<meta name="rdf:about" content="test"/>',
+    ]),
 })
 
-print(f"\nDone! Created Batch 2 (Advanced Content Documents) fixtures.")
-
 
 # ============================================================================
 # BATCH 3: Accessibility Checks
 # ============================================================================
-print("\n=== Batch 3: Accessibility (ACC) ===")
+batch("Batch 3: Accessibility (ACC)", "Batch 3 (Accessibility)")
 
 # ACC-001: No accessibility metadata at all
-create_fixture("acc-no-a11y-metadata", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("acc-no-a11y-metadata", {
+    "OEBPS/content.opf": build_opf(),
 })
 
 # ACC-002: Image without alt attribute
-create_fixture("acc-img-no-alt", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="img1" href="cover.png" media-type="image/png"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p><img src="cover.png"/></p>
-</body>
-</html>""",
+fixture("acc-img-no-alt", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        CHAPTER1_ITEM,
+        '<item id="img1" href="cover.png" media-type="image/png"/>',
+    ]),
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<p><img src="cover.png"/></p>',
+    ]),
     "OEBPS/cover.png": b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82',
 })
 
 # ACC-003: Content document html element missing lang attribute
-create_fixture("acc-no-lang", {
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p>Hello, world.</p>
-</body>
-</html>""",
+fixture("acc-no-lang", {
+    "OEBPS/chapter1.xhtml": build_xhtml(),
 })
 
 # ACC-004: dc:source present but no page-list navigation
-create_fixture("acc-dc-source-no-page-list", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <dc:source>urn:isbn:9780123456789</dc:source>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("acc-dc-source-no-page-list", {
+    "OEBPS/content.opf": build_opf(dc=["<dc:source>urn:isbn:9780123456789</dc:source>"]),
 })
 
 # ACC-005: Missing schema:accessMode metadata
-create_fixture("acc-no-accessmode", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid"
-         prefix="schema: http://schema.org/">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="schema:accessibilitySummary">No accessibility features</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("acc-no-accessmode", {
+    "OEBPS/content.opf": build_opf(meta=[
+        '<meta property="schema:accessibilitySummary">No accessibility features</meta>',
+    ], prefix=SCHEMA_PREFIX),
 })
 
 # ACC-006: Missing schema:accessModeSufficient metadata
-create_fixture("acc-no-access-sufficient", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid"
-         prefix="schema: http://schema.org/">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="schema:accessMode">textual</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("acc-no-access-sufficient", {
+    "OEBPS/content.opf": build_opf(meta=[
+        '<meta property="schema:accessMode">textual</meta>',
+    ], prefix=SCHEMA_PREFIX),
 })
 
 # ACC-007: Missing schema:accessibilitySummary metadata
-create_fixture("acc-no-summary", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid"
-         prefix="schema: http://schema.org/">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="schema:accessMode">textual</meta>
-    <meta property="schema:accessModeSufficient">textual</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("acc-no-summary", {
+    "OEBPS/content.opf": build_opf(meta=[
+        '<meta property="schema:accessMode">textual</meta>',
+        '<meta property="schema:accessModeSufficient">textual</meta>',
+    ], prefix=SCHEMA_PREFIX),
 })
 
 # ACC-008: Missing schema:accessibilityFeature metadata
-create_fixture("acc-no-feature", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid"
-         prefix="schema: http://schema.org/">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="schema:accessMode">textual</meta>
-    <meta property="schema:accessModeSufficient">textual</meta>
-    <meta property="schema:accessibilitySummary">Test summary</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("acc-no-feature", {
+    "OEBPS/content.opf": build_opf(meta=[
+        '<meta property="schema:accessMode">textual</meta>',
+        '<meta property="schema:accessModeSufficient">textual</meta>',
+        '<meta property="schema:accessibilitySummary">Test summary</meta>',
+    ], prefix=SCHEMA_PREFIX),
 })
 
 # ACC-009: Missing schema:accessibilityHazard metadata
-create_fixture("acc-no-hazard", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid"
-         prefix="schema: http://schema.org/">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="schema:accessMode">textual</meta>
-    <meta property="schema:accessModeSufficient">textual</meta>
-    <meta property="schema:accessibilitySummary">Test summary</meta>
-    <meta property="schema:accessibilityFeature">structuralNavigation</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("acc-no-hazard", {
+    "OEBPS/content.opf": build_opf(meta=[
+        '<meta property="schema:accessMode">textual</meta>',
+        '<meta property="schema:accessModeSufficient">textual</meta>',
+        '<meta property="schema:accessibilitySummary">Test summary</meta>',
+        '<meta property="schema:accessibilityFeature">structuralNavigation</meta>',
+    ], prefix=SCHEMA_PREFIX),
 })
 
-# ACC-010: No landmarks navigation
-create_fixture("acc-no-landmarks", {
-    "OEBPS/nav.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
-<head><title>Navigation</title></head>
-<body>
-  <nav epub:type="toc">
-    <h1>Table of Contents</h1>
-    <ol>
-      <li><a href="chapter1.xhtml">Chapter 1</a></li>
-    </ol>
-  </nav>
-</body>
-</html>""",
+# ACC-010: No landmarks navigation (the default nav has only a toc)
+fixture("acc-no-landmarks", {
+    "OEBPS/nav.xhtml": NAV_XHTML,
 })
 
-print(f"\nDone! Created Batch 3 (Accessibility) fixtures.")
-
 
 # ============================================================================
 # BATCH 4: Media Overlays
 # ============================================================================
-print("\n=== Batch 4: Media Overlays ===")
+batch("Batch 4: Media Overlays", "Batch 4 (Media Overlays)")
 
 # Minimal valid MP3 header (silence, valid MPEG audio frame header)
 MINIMAL_MP3 = b'\xff\xfb\x90\x00' + b'\x00' * 417
 
+# Chapter whose paragraph the overlays below point at as chapter1.xhtml#p1
+OVERLAY_CHAPTER1 = build_xhtml(body=['<p id="p1">Hello, world.</p>'])
+
 # MED-006: Malformed SMIL media overlay
-create_fixture("media-overlay-malformed", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="media:duration" refines="#ch1overlay">0:00:01.000</meta>
-    <meta property="media:duration">0:00:01.000</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>
-    <item id="ch1overlay" href="chapter1.smil" media-type="application/smil+xml"/>
-    <item id="audio1" href="audio.mp3" media-type="audio/mpeg"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("media-overlay-malformed", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>',
+        '<item id="ch1overlay" href="chapter1.smil" media-type="application/smil+xml"/>',
+        '<item id="audio1" href="audio.mp3" media-type="audio/mpeg"/>',
+    ], meta=[
+        '<meta property="media:duration" refines="#ch1overlay">0:00:01.000</meta>',
+        '<meta property="media:duration">0:00:01.000</meta>',
+    ]),
     "OEBPS/chapter1.smil": """<?xml version="1.0" encoding="UTF-8"?>
 <smil xmlns="http://www.w3.org/ns/SMIL" version="3.0">
   <body>
@@ -838,26 +375,15 @@ create_fixture("media-overlay-malformed", {
 })
 
 # MED-007: Audio file referenced in overlay doesn't exist
-create_fixture("media-overlay-audio-missing", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="media:duration" refines="#ch1overlay">0:00:01.000</meta>
-    <meta property="media:duration">0:00:01.000</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>
-    <item id="ch1overlay" href="chapter1.smil" media-type="application/smil+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("media-overlay-audio-missing", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>',
+        '<item id="ch1overlay" href="chapter1.smil" media-type="application/smil+xml"/>',
+    ], meta=[
+        '<meta property="media:duration" refines="#ch1overlay">0:00:01.000</meta>',
+        '<meta property="media:duration">0:00:01.000</meta>',
+    ]),
     "OEBPS/chapter1.smil": """<?xml version="1.0" encoding="UTF-8"?>
 <smil xmlns="http://www.w3.org/ns/SMIL" version="3.0">
   <body>
@@ -869,39 +395,20 @@ create_fixture("media-overlay-audio-missing", {
     </seq>
   </body>
 </smil>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p id="p1">Hello, world.</p>
-</body>
-</html>""",
+    "OEBPS/chapter1.xhtml": OVERLAY_CHAPTER1,
 })
 
 # MED-008: Text ref in overlay points to nonexistent fragment
-create_fixture("media-overlay-text-missing", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="media:duration" refines="#ch1overlay">0:00:01.000</meta>
-    <meta property="media:duration">0:00:01.000</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>
-    <item id="ch1overlay" href="chapter1.smil" media-type="application/smil+xml"/>
-    <item id="audio1" href="audio.mp3" media-type="audio/mpeg"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("media-overlay-text-missing", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>',
+        '<item id="ch1overlay" href="chapter1.smil" media-type="application/smil+xml"/>',
+        '<item id="audio1" href="audio.mp3" media-type="audio/mpeg"/>',
+    ], meta=[
+        '<meta property="media:duration" refines="#ch1overlay">0:00:01.000</meta>',
+        '<meta property="media:duration">0:00:01.000</meta>',
+    ]),
     "OEBPS/chapter1.smil": """<?xml version="1.0" encoding="UTF-8"?>
 <smil xmlns="http://www.w3.org/ns/SMIL" version="3.0">
   <body>
@@ -913,38 +420,18 @@ create_fixture("media-overlay-text-missing", {
     </seq>
   </body>
 </smil>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p id="p1">Hello, world.</p>
-</body>
-</html>""",
+    "OEBPS/chapter1.xhtml": OVERLAY_CHAPTER1,
     "OEBPS/audio.mp3": MINIMAL_MP3,
 })
 
 # MED-009: Media overlay present but no duration metadata
-create_fixture("media-overlay-no-duration", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>
-    <item id="ch1overlay" href="chapter1.smil" media-type="application/smil+xml"/>
-    <item id="audio1" href="audio.mp3" media-type="audio/mpeg"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("media-overlay-no-duration", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>',
+        '<item id="ch1overlay" href="chapter1.smil" media-type="application/smil+xml"/>',
+        '<item id="audio1" href="audio.mp3" media-type="audio/mpeg"/>',
+    ]),
     "OEBPS/chapter1.smil": """<?xml version="1.0" encoding="UTF-8"?>
 <smil xmlns="http://www.w3.org/ns/SMIL" version="3.0">
   <body>
@@ -956,40 +443,21 @@ create_fixture("media-overlay-no-duration", {
     </seq>
   </body>
 </smil>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p id="p1">Hello, world.</p>
-</body>
-</html>""",
+    "OEBPS/chapter1.xhtml": OVERLAY_CHAPTER1,
     "OEBPS/audio.mp3": MINIMAL_MP3,
 })
 
 # MED-010: Invalid SMIL clock value in clipBegin/clipEnd
-create_fixture("media-overlay-clip-invalid", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="media:duration" refines="#ch1overlay">0:00:01.000</meta>
-    <meta property="media:duration">0:00:01.000</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>
-    <item id="ch1overlay" href="chapter1.smil" media-type="application/smil+xml"/>
-    <item id="audio1" href="audio.mp3" media-type="audio/mpeg"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("media-overlay-clip-invalid", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>',
+        '<item id="ch1overlay" href="chapter1.smil" media-type="application/smil+xml"/>',
+        '<item id="audio1" href="audio.mp3" media-type="audio/mpeg"/>',
+    ], meta=[
+        '<meta property="media:duration" refines="#ch1overlay">0:00:01.000</meta>',
+        '<meta property="media:duration">0:00:01.000</meta>',
+    ]),
     "OEBPS/chapter1.smil": """<?xml version="1.0" encoding="UTF-8"?>
 <smil xmlns="http://www.w3.org/ns/SMIL" version="3.0">
   <body>
@@ -1001,40 +469,21 @@ create_fixture("media-overlay-clip-invalid", {
     </seq>
   </body>
 </smil>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p id="p1">Hello, world.</p>
-</body>
-</html>""",
+    "OEBPS/chapter1.xhtml": OVERLAY_CHAPTER1,
     "OEBPS/audio.mp3": MINIMAL_MP3,
 })
 
 # MED-011: SMIL with invalid structure (missing seq/par)
-create_fixture("media-overlay-bad-structure", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="media:duration" refines="#ch1overlay">0:00:01.000</meta>
-    <meta property="media:duration">0:00:01.000</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>
-    <item id="ch1overlay" href="chapter1.smil" media-type="application/smil+xml"/>
-    <item id="audio1" href="audio.mp3" media-type="audio/mpeg"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("media-overlay-bad-structure", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>',
+        '<item id="ch1overlay" href="chapter1.smil" media-type="application/smil+xml"/>',
+        '<item id="audio1" href="audio.mp3" media-type="audio/mpeg"/>',
+    ], meta=[
+        '<meta property="media:duration" refines="#ch1overlay">0:00:01.000</meta>',
+        '<meta property="media:duration">0:00:01.000</meta>',
+    ]),
     "OEBPS/chapter1.smil": """<?xml version="1.0" encoding="UTF-8"?>
 <smil xmlns="http://www.w3.org/ns/SMIL" version="3.0">
   <body>
@@ -1042,98 +491,52 @@ create_fixture("media-overlay-bad-structure", {
     <audio src="audio.mp3" clipBegin="0s" clipEnd="1s"/>
   </body>
 </smil>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p id="p1">Hello, world.</p>
-</body>
-</html>""",
+    "OEBPS/chapter1.xhtml": OVERLAY_CHAPTER1,
     "OEBPS/audio.mp3": MINIMAL_MP3,
 })
 
 # MED-012: Video with non-core media type and no fallback
-create_fixture("video-non-core-type", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="vid1" href="clip.avi" media-type="video/x-msvideo"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p><video src="clip.avi">Video</video></p>
-</body>
-</html>""",
+fixture("video-non-core-type", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        CHAPTER1_ITEM,
+        '<item id="vid1" href="clip.avi" media-type="video/x-msvideo"/>',
+    ]),
+    "OEBPS/chapter1.xhtml": build_xhtml(body=[
+        '<p><video src="clip.avi">Video</video></p>',
+    ]),
     "OEBPS/clip.avi": b'RIFF\x00\x00\x00\x00AVI ',
 })
 
 # MED-013: media-overlay property declared but item is wrong type
-create_fixture("media-overlay-no-property", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-    <meta property="media:duration" refines="#ch1overlay">0:00:01.000</meta>
-    <meta property="media:duration">0:00:01.000</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>
-    <item id="ch1overlay" href="chapter1_overlay.xhtml" media-type="application/xhtml+xml"/>
-    <item id="audio1" href="audio.mp3" media-type="audio/mpeg"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("media-overlay-no-property", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml" media-overlay="ch1overlay"/>',
+        '<item id="ch1overlay" href="chapter1_overlay.xhtml" media-type="application/xhtml+xml"/>',
+        '<item id="audio1" href="audio.mp3" media-type="audio/mpeg"/>',
+    ], meta=[
+        '<meta property="media:duration" refines="#ch1overlay">0:00:01.000</meta>',
+        '<meta property="media:duration">0:00:01.000</meta>',
+    ]),
     "OEBPS/chapter1_overlay.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml">
 <head><title>Not a SMIL file</title></head>
 <body><p>This is not a media overlay</p></body>
 </html>""",
-    "OEBPS/chapter1.xhtml": """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Chapter 1</title></head>
-<body>
-  <h1>Chapter 1</h1>
-  <p id="p1">Hello, world.</p>
-</body>
-</html>""",
+    "OEBPS/chapter1.xhtml": OVERLAY_CHAPTER1,
     "OEBPS/audio.mp3": MINIMAL_MP3,
 })
 
-print(f"\nDone! Created Batch 4 (Media Overlays) fixtures.")
 
 # ============================================================================
 # BATCH 5: Container & EPUB 2 Edge Cases
 # ============================================================================
-print("\n=== Batch 5: Container & EPUB 2 Edge Cases ===")
+batch("Batch 5: Container & EPUB 2 Edge Cases", "Batch 5 (Container & EPUB 2 Edge Cases)")
 
 # OCF-013: encryption.xml that is malformed XML
-create_fixture("ocf-encryption-malformed", {
+fixture("ocf-encryption-malformed", {
     "META-INF/encryption.xml": """<?xml version="1.0" encoding="UTF-8"?>
 <encryption xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
   <EncryptedData>
@@ -1143,7 +546,7 @@ create_fixture("ocf-encryption-malformed", {
 })
 
 # OCF-014: container.xml with invalid version attribute
-create_fixture("ocf-container-bad-version", {
+fixture("ocf-container-bad-version", {
     "META-INF/container.xml": """<?xml version="1.0" encoding="UTF-8"?>
 <container version="2.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
   <rootfiles>
@@ -1153,47 +556,23 @@ create_fixture("ocf-container-bad-version", {
 })
 
 # OCF-015: filename with restricted characters (backslash)
-create_fixture("ocf-filename-invalid-chars", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="extra" href="file%00name.xhtml" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("ocf-filename-invalid-chars", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        CHAPTER1_ITEM,
+        '<item id="extra" href="file%00name.xhtml" media-type="application/xhtml+xml"/>',
+    ]),
 })
 
 # OCF-016: filename that is excessively long (> 65535 bytes)
 # Create a filename just over the limit
 LONG_NAME = "a" * 200 + ".xhtml"
-create_fixture("ocf-filename-too-long", {
-    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">
-  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
-    <dc:title>Test Book</dc:title>
-    <dc:language>en</dc:language>
-    <meta property="dcterms:modified">2025-01-01T00:00:00Z</meta>
-  </metadata>
-  <manifest>
-    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
-    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
-    <item id="longfile" href="{LONG_NAME}" media-type="application/xhtml+xml"/>
-  </manifest>
-  <spine>
-    <itemref idref="chapter1"/>
-  </spine>
-</package>""",
+fixture("ocf-filename-too-long", {
+    "OEBPS/content.opf": build_opf(manifest=[
+        NAV_ITEM,
+        CHAPTER1_ITEM,
+        f'<item id="longfile" href="{LONG_NAME}" media-type="application/xhtml+xml"/>',
+    ]),
     f"OEBPS/{LONG_NAME}": """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml">
@@ -1203,11 +582,11 @@ create_fixture("ocf-filename-too-long", {
 })
 
 # E2-012: EPUB 2 with invalid guide reference type
-create_fixture("epub2-guide-invalid-type", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("epub2-guide-invalid-type", {
+    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="uid">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
+    <dc:identifier id="uid">{BOOK_ID}</dc:identifier>
     <dc:title>Test Book</dc:title>
     <dc:language>en</dc:language>
   </metadata>
@@ -1225,11 +604,11 @@ create_fixture("epub2-guide-invalid-type", {
 }, base="epub2")
 
 # E2-013: EPUB 2 with invalid MARC relator role on dc:creator
-create_fixture("epub2-dc-creator-bad-role", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("epub2-dc-creator-bad-role", {
+    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="uid">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
+    <dc:identifier id="uid">{BOOK_ID}</dc:identifier>
     <dc:title>Test Book</dc:title>
     <dc:language>en</dc:language>
     <dc:creator opf:role="xyz">Test Author</dc:creator>
@@ -1245,11 +624,11 @@ create_fixture("epub2-dc-creator-bad-role", {
 }, base="epub2")
 
 # E2-014: EPUB 2 OPF elements in wrong order (spine before manifest)
-create_fixture("epub2-opf-wrong-order", {
-    "OEBPS/content.opf": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("epub2-opf-wrong-order", {
+    "OEBPS/content.opf": f"""<?xml version="1.0" encoding="UTF-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="uid">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
-    <dc:identifier id="uid">urn:uuid:12345678-1234-1234-1234-123456789012</dc:identifier>
+    <dc:identifier id="uid">{BOOK_ID}</dc:identifier>
     <dc:title>Test Book</dc:title>
     <dc:language>en</dc:language>
   </metadata>
@@ -1264,11 +643,11 @@ create_fixture("epub2-opf-wrong-order", {
 }, base="epub2")
 
 # E2-015: EPUB 2 NCX with depth mismatch (says 2, but actual depth is 1)
-create_fixture("epub2-ncx-depth-mismatch", {
-    "OEBPS/toc.ncx": """<?xml version="1.0" encoding="UTF-8"?>
+fixture("epub2-ncx-depth-mismatch", {
+    "OEBPS/toc.ncx": f"""<?xml version="1.0" encoding="UTF-8"?>
 <ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
   <head>
-    <meta name="dtb:uid" content="urn:uuid:12345678-1234-1234-1234-123456789012"/>
+    <meta name="dtb:uid" content="{BOOK_ID}"/>
     <meta name="dtb:depth" content="3"/>
     <meta name="dtb:totalPageCount" content="0"/>
     <meta name="dtb:maxPageNumber" content="0"/>
@@ -1283,4 +662,40 @@ create_fixture("epub2-ncx-depth-mismatch", {
 </ncx>""",
 }, base="epub2")
 
-print(f"\nDone! Created Batch 5 (Container & EPUB 2 Edge Cases) fixtures.")
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def build_all(names=None, parallel=True):
+    """Write the declared fixtures, batch by batch.
+
+    names limits the build to those fixtures; by default every fixture is
+    written. Each fixture owns its directory and the work is file I/O, so
+    with parallel=True each batch runs on a thread pool; the status lines
+    are printed in declaration order either way.
+    """
+    check_fixture_names(names, FIXTURES)
+
+    executor = concurrent.futures.ThreadPoolExecutor() if parallel else None
+    try:
+        for title, summary, group in FIXTURE_GROUPS:
+            if names is not None:
+                group = [name for name in group if name in names]
+                if not group:
+                    continue
+            if executor is None:
+                lines = map(create_fixture, group)
+            else:
+                lines = executor.map(create_fixture, group)
+            # Each batch's header, status lines and summary go out in one write.
+            print("\n".join([f"\n=== {title} ===", *lines,
+                             f"\nDone! Created {summary} fixtures."]), flush=True)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+if __name__ == "__main__":
+    # Optional fixture names on the command line rebuild just those.
+    build_all(sys.argv[1:] or None)
@@ -0,0 +1,43 @@
+"""JSON helpers shared by the create-level*-expected.py scripts.
+
+The scripts run from the repository root, so this module is imported
+from the scripts directory.
+"""
+import functools
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj):
+    """Serialize obj as 2-space-indented JSON bytes with a trailing newline.
+
+    Uses orjson when it is installed; the stdlib fallback produces the same
+    bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def json_loads(data):
+    """Parse JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def load_reference(ref_path):
+    """Parse a reference JSON file, once per path, or None if it is missing.
+
+    The parsed dict is shared between callers and must not be modified.
+    """
+    try:
+        with open(ref_path, "rb") as f:
+            return json_loads(f.read())
+    except FileNotFoundError:
+        return None
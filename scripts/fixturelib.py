@@ -0,0 +1,273 @@
+"""Shared pieces of the create-level*-fixtures.py generators.
+
+The base documents of minimal-epub3 and minimal-epub2, the builders that
+derive fixture documents from them, and the helpers that encode fixture
+files and sync them to disk. The generators run as scripts from the
+repository root, so this module is imported from the scripts directory.
+"""
+import functools
+import os
+
+FIXTURES_SRC = "fixtures/src"
+
+# dc:identifier (and NCX dtb:uid) and dcterms:modified values used by every
+# fixture package
+BOOK_ID = "urn:uuid:12345678-1234-1234-1234-123456789012"
+MODIFIED = "2025-01-01T00:00:00Z"
+
+# Opening lines and required metadata shared by the EPUB 3 package
+# documents; build_opf fills in the fields fixtures vary, and PACKAGE_OPEN
+# and DC_METADATA are the minimal-epub3 values.
+PACKAGE_OPEN_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="{version}" unique-identifier="uid"{prefix_attr}>
+"""
+
+DC_METADATA_TEMPLATE = """    <dc:identifier id="uid">{identifier}</dc:identifier>
+    <dc:title>Test Book</dc:title>
+    <dc:language>{language}</dc:language>
+{dc_extra}    <meta property="dcterms:modified">{modified}</meta>
+"""
+
+PACKAGE_OPEN = PACKAGE_OPEN_TEMPLATE.format(version="3.0", prefix_attr="")
+DC_METADATA = DC_METADATA_TEMPLATE.format(identifier=BOOK_ID, language="en",
+                                          dc_extra="", modified=MODIFIED)
+
+# Manifest/spine entries of the base package document
+NAV_ITEM = '<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>'
+CHAPTER1_ITEM = '<item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>'
+CHAPTER1_ITEMREF = '<itemref idref="chapter1"/>'
+
+
+def build_opf(manifest=(NAV_ITEM, CHAPTER1_ITEM), spine=(CHAPTER1_ITEMREF,), meta=(),
+              version="3.0", language="en", modified=MODIFIED, prefix=None,
+              identifier=BOOK_ID, spine_attrs="", guide=None, dc=()):
+    """Return an EPUB 3 package document laid out like CONTENT_OPF.
+
+    manifest and spine are the child elements of <manifest> and <spine>;
+    spine=None leaves the <spine> element out entirely, and spine_attrs is
+    appended to its start tag. dc elements follow dc:language and meta
+    lines are appended to the standard DC metadata; version, identifier,
+    language and modified fill the package version, dc:identifier,
+    dc:language and dcterms:modified.
+    prefix, if given, is declared on a continuation line of <package>, and
+    guide, if given, holds the <reference> elements of a <guide> after the
+    spine.
+    """
+    def lines(elements):
+        return "".join(f"    {element}\n" for element in elements)
+
+    spine_block = "" if spine is None else f"  <spine{spine_attrs}>\n{lines(spine)}  </spine>\n"
+    guide_block = "" if guide is None else f"  <guide>\n{lines(guide)}  </guide>\n"
+    prefix_attr = "" if prefix is None else f'\n         prefix="{prefix}"'
+    package_open = PACKAGE_OPEN_TEMPLATE.format(version=version, prefix_attr=prefix_attr)
+    dc_metadata = DC_METADATA_TEMPLATE.format(identifier=identifier, language=language,
+                                              dc_extra=lines(dc), modified=modified)
+    return f"""{package_open}  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+{dc_metadata}{lines(meta)}  </metadata>
+  <manifest>
+{lines(manifest)}  </manifest>
+{spine_block}{guide_block}</package>"""
+
+
+def build_xhtml(body=("<p>Hello, world.</p>",), head=(), title="Chapter 1",
+                doctype="<!DOCTYPE html>", xmlns="http://www.w3.org/1999/xhtml"):
+    """Return a chapter document laid out like CHAPTER1_XHTML.
+
+    body lines follow the <h1> heading, and head lines follow the <title>;
+    title=None gives an empty <head>.
+    """
+    def lines(elements):
+        return "".join(f"  {element}\n" for element in elements)
+
+    if head:
+        head_block = f"<head>\n  <title>{title}</title>\n{lines(head)}</head>"
+    elif title is None:
+        head_block = "<head></head>"
+    else:
+        head_block = f"<head><title>{title}</title></head>"
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+{doctype}
+<html xmlns="{xmlns}">
+{head_block}
+<body>
+  <h1>Chapter 1</h1>
+{lines(body)}</body>
+</html>"""
+
+
+# --- Base file contents (from minimal-epub3) ---
+
+MIMETYPE = "application/epub+zip"
+
+CONTAINER_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>"""
+
+CONTENT_OPF = build_opf()
+
+NAV_XHTML = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
+<head><title>Navigation</title></head>
+<body>
+  <nav epub:type="toc">
+    <h1>Table of Contents</h1>
+    <ol>
+      <li><a href="chapter1.xhtml">Chapter 1</a></li>
+    </ol>
+  </nav>
+</body>
+</html>"""
+
+CHAPTER1_XHTML = build_xhtml()
+
+# Default file contents for minimal-epub3
+DEFAULTS = {
+    "mimetype": MIMETYPE,
+    "META-INF/container.xml": CONTAINER_XML,
+    "OEBPS/content.opf": CONTENT_OPF,
+    "OEBPS/nav.xhtml": NAV_XHTML,
+    "OEBPS/chapter1.xhtml": CHAPTER1_XHTML,
+}
+
+def build_epub2_opf(spine_attrs=' toc="ncx"'):
+    """Return the minimal-epub2 package document.
+
+    spine_attrs is appended to the <spine> start tag; fixtures pass "" to
+    drop the toc attribute.
+    """
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="uid">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
+    <dc:identifier id="uid">{BOOK_ID}</dc:identifier>
+    <dc:title>Test Book</dc:title>
+    <dc:language>en</dc:language>
+  </metadata>
+  <manifest>
+    <item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>
+    <item id="chapter1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
+  </manifest>
+  <spine{spine_attrs}>
+    <itemref idref="chapter1"/>
+  </spine>
+</package>"""
+
+
+# Default file contents for minimal-epub2
+EPUB2_DEFAULTS = {
+    "mimetype": MIMETYPE,
+    "META-INF/container.xml": CONTAINER_XML,
+    "OEBPS/content.opf": build_epub2_opf(),
+    "OEBPS/toc.ncx": f"""<?xml version="1.0" encoding="UTF-8"?>
+<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
+  <head>
+    <meta name="dtb:uid" content="{BOOK_ID}"/>
+    <meta name="dtb:depth" content="1"/>
+    <meta name="dtb:totalPageCount" content="0"/>
+    <meta name="dtb:maxPageNumber" content="0"/>
+  </head>
+  <docTitle><text>Test Book</text></docTitle>
+  <navMap>
+    <navPoint id="np-1" playOrder="1">
+      <navLabel><text>Chapter 1</text></navLabel>
+      <content src="chapter1.xhtml"/>
+    </navPoint>
+  </navMap>
+</ncx>""",
+    "OEBPS/chapter1.xhtml": build_xhtml(doctype='<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">'),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def encode(text):
+    """UTF-8 encode text, once per distinct string.
+
+    The default documents, and shared ones such as a styled package or an
+    EPUB 2 chapter, go into many fixtures; they are encoded the first time
+    and reused after that.
+    """
+    return text.encode("utf-8")
+
+
+# Default files encoded once; every fixture writes these same bytes. The
+# str constants above stay str so fixtures can derive variants from them.
+DEFAULTS_BYTES = {path: encode(content) for path, content in DEFAULTS.items()}
+EPUB2_DEFAULTS_BYTES = {path: encode(content) for path, content in EPUB2_DEFAULTS.items()}
+
+
+def encode_files(files):
+    """Return a copy of files with str contents encoded as UTF-8."""
+    return {
+        relpath: encode(content) if isinstance(content, str) else content
+        for relpath, content in files.items()
+    }
+
+
+def write_files(fixture_dir, files):
+    """Write {relative_path: bytes} under fixture_dir.
+
+    Each parent directory is created once.  Files go through a buffered
+    binary open(), whose write() keeps going until every byte is written;
+    a bare os.write may write only part of its buffer.
+    """
+    for subdir in {os.path.dirname(relpath) for relpath in files}:
+        os.makedirs(os.path.join(fixture_dir, subdir), exist_ok=True)
+
+    for relpath, content in files.items():
+        with open(os.path.join(fixture_dir, relpath), 'wb') as f:
+            f.write(content)
+
+
+def check_fixture_names(names, fixtures):
+    """Exit with an error if names includes any fixture not in fixtures.
+
+    names is the subset requested on a generator's command line, or None
+    for every fixture.
+    """
+    if names is not None:
+        unknown = set(names) - fixtures.keys()
+        if unknown:
+            raise SystemExit(f"Unknown fixture(s): {', '.join(sorted(unknown))}")
+
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def write_fixture(fixture_dir, files):
+    """Bring fixture_dir in line with files, touching only what differs.
+
+    Files whose bytes already match are left alone, files the fixture no
+    longer has are removed (with any directories that leaves empty), and
+    the rest are written.  Comparing against what is on disk rather than a
+    stored hash means hand-edited fixtures still get restored, and nothing
+    extra lands in the directory that build-fixtures.sh zips.  Returns
+    True if anything on disk changed.
+    """
+    existing = {
+        os.path.relpath(os.path.join(root, filename), fixture_dir)
+        for root, _dirs, filenames in os.walk(fixture_dir)
+        for filename in filenames
+    }
+
+    removed = existing - files.keys()
+    for relpath in removed:
+        path = os.path.join(fixture_dir, relpath)
+        os.remove(path)
+        parent = os.path.dirname(path)
+        while parent != fixture_dir and not os.listdir(parent):
+            os.rmdir(parent)
+            parent = os.path.dirname(parent)
+
+    stale = {
+        relpath: content for relpath, content in files.items()
+        if relpath not in existing
+        or read_file(os.path.join(fixture_dir, relpath)) != content
+    }
+    write_files(fixture_dir, stale)
+
+    return bool(removed or stale)